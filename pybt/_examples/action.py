@@ -31,14 +31,15 @@ import pybt.console as console
 
 
 def description():
-    content = "Demonstrates the characteristics of a typical 'action' behaviour.\n"
-    content += "\n"
-    content += "* Mocks an external process and connects to it in the setup() method\n"
-    content += "* Kickstarts new goals with the external process in the initialise() method\n"
-    content += "* Monitors the ongoing goal status in the update() method\n"
-    content += "* Determines RUNNING/SUCCESS pending feedback from the external process\n"
-    s = content
-    return s
+    content = (
+        "Demonstrates the characteristics of a typical 'action' behaviour.\n"
+        "\n"
+        "* Mocks an external process and connects to it in the setup() method\n"
+        "* Kickstarts new goals with the external process in the initialise() method\n"
+        "* Monitors the ongoing goal status in the update() method\n"
+        "* Determines RUNNING/SUCCESS pending feedback from the external process\n"
+    )
+    return content
 
 def planning(pipe_connection):
     """
@@ -36,12 +36,13 @@ import pybt
 
 
 def description():
-    content = "Demonstrates usage of the blackboard and related behaviours.\n"
-    content += "\n"
-    content += "A sequence is populated with a few behaviours that exercise\n"
-    content += "reading and writing on the Blackboard in interesting ways.\n"
-    s = content
-    return s
+    content = (
+        "Demonstrates usage of the blackboard and related behaviours.\n"
+        "\n"
+        "A sequence is populated with a few behaviours that exercise\n"
+        "reading and writing on the Blackboard in interesting ways.\n"
+    )
+    return content
 
 class Nested(object):
     """
@@ -58,11 +59,18 @@ class BlackboardWriter(pybt.behaviour.Behaviour):
     """
     Custom writer that submits a more complicated variable to the blackboard.
     """
+    # key table shared by all writers, access is tracked per client so
+    # each instance still registers it on its own client
+    _keys = (
+        ("dude", pybt.common.Access.READ),
+        ("spaghetti", pybt.common.Access.WRITE),
+    )
+
     def __init__(self, name="Writer"):
         super().__init__(name=name)
         self.blackboard = self.attach_blackboard_client()
-        self.blackboard.register_key(key="dude", access=pybt.common.Access.READ)
-        self.blackboard.register_key(key="spaghetti", access=pybt.common.Access.WRITE)
+        for key, access in self._keys:
+            self.blackboard.register_key(key=key, access=access)
 
         self.logger.debug("%s.__init__()" % (self.__class__.__name__))
 
@@ -71,24 +79,17 @@ class BlackboardWriter(pybt.behaviour.Behaviour):
         Write a dictionary to the blackboard and return :data:`~py_trees.common.Status.SUCCESS`.
         """
         self.logger.debug("%s.update()" % (self.__class__.__name__))
-        try:
+        if "dude" in self.blackboard:
             unused = self.blackboard.dude
-        except KeyError:
-            pass
-        try:
+        # check permissions up front rather than catching the AttributeError
+        if self.blackboard.is_registered("dudette"):
             unused = self.blackboard.dudette
-        except AttributeError:
-            pass
-        try:
+        if self.blackboard.is_registered("dudette", access=pybt.common.Access.WRITE):
             self.blackboard.dudette = "Jane"
-        except AttributeError:
-            pass
         self.blackboard.spaghetti = {"type": "Carbonara", "quantity": 1}
         self.blackboard.spaghetti = {"type": "Gnocchi", "quantity": 2}
-        try:
-            self.blackboard.set("spaghetti", {"type": "Bolognese", "quantity": 3}, overwrite=False)
-        except AttributeError:
-            pass
+        # already set, so this returns False rather than raising
+        self.blackboard.set("spaghetti", {"type": "Bolognese", "quantity": 3}, overwrite=False)
         return pybt.common.Status.SUCCESS
 
 
@@ -97,20 +98,19 @@ class ParamsAndState(pybt.behaviour.Behaviour):
     A more esotoric use of multiple blackboards in a behaviour to represent
     storage of parameters and state.
     """
+    _parameter_keys = (("default_speed", pybt.common.Access.READ),)
+    _state_keys = (("current_speed", pybt.common.Access.WRITE),)
+
     def __init__(self, name="ParamsAndState"):
         super().__init__(name=name)
         # namespaces can include the separator or may leave it out
         # they can also be nested, e.g. /agent/state, /agent/parameters
         self.parameters = self.attach_blackboard_client("Params", "parameters")
         self.state = self.attach_blackboard_client("State", "state")
-        self.parameters.register_key(
-            key="default_speed",
-            access=pybt.common.Access.READ
-        )
-        self.state.register_key(
-            key="current_speed",
-            access=pybt.common.Access.WRITE
-        )
+        for key, access in self._parameter_keys:
+            self.parameters.register_key(key=key, access=access)
+        for key, access in self._state_keys:
+            self.state.register_key(key=key, access=access)
 
     def initialise(self):
         try:
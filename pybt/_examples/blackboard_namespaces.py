@@ -31,10 +31,11 @@ import pybt
 
 
 def description():
-    content = "Demonstrates usage of blackboard namespaces.\n"
-    content += "\n"
-    s = content
-    return s
+    content = (
+        "Demonstrates usage of blackboard namespaces.\n"
+        "\n"
+    )
+    return content
 
 ##############################################################################
 # Main
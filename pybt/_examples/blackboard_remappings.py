@@ -35,11 +35,12 @@ import pybt.console as console
 
 
 def description():
-    content = "Demonstrates usage of blackbord remappings.\n"
-    content += "\n"
-    content += "Demonstration is via an exemplar behaviour making use of remappings..\n"
-    s = content
-    return s
+    content = (
+        "Demonstrates usage of blackbord remappings.\n"
+        "\n"
+        "Demonstration is via an exemplar behaviour making use of remappings..\n"
+    )
+    return content
 
 class Remap(pybt.behaviour.Behaviour):
     """
@@ -54,13 +55,16 @@ class Remap(pybt.behaviour.Behaviour):
             access=pybt.common.Access.WRITE,
             remap_to=remap_to["/foo/bar/wow"]
         )
+        # resolved once here, the client applies the remapping on every write
+        self._write_wow = self.blackboard.prepare_write("/foo/bar/wow")
 
     def update(self):
         """
         Write a dictionary to the blackboard and return :data:`~py_trees.common.Status.SUCCESS`.
         """
-        self.logger.debug("%s.update()" % (self.__class__.__name__))
-        self.blackboard.foo.bar.wow = "colander"
+        if pybt.logging.level < pybt.logging.INFO:
+            self.logger.debug("%s.update()", self.__class__.__name__)
+        self._write_wow("colander")
 
         return pybt.common.Status.SUCCESS
 
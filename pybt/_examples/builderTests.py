@@ -1,9 +1,8 @@
-import time
 import pybt.logging as logger
 import pybt.builder as pb
 
 from pybt._demos import *
-from pybt.common import Status
+from pybt.common import SUCCESS
 from pybt.behaviour import Behaviour
 
 class MyAction(Behaviour):
@@ -15,14 +14,16 @@ class MyAction(Behaviour):
         self.logger.debug("%s[MyAction::setup()]" % self.name)
         self.blackboard = self.attach_blackboard_client("main", "Actions")
         self.blackboard.register_key(self.name, pb.common.Access.READ)
+        # the key is just the name, no need to rebuild it every tick
+        self._key = self.name
+        self._set = self.blackboard.set
 
     def initialise(self):
         self.logger.debug("%s[MyAction::initialise()]" % self.name)
 
     def update(self):
-        #time.sleep(1)
-        self.blackboard.set("{0}".format(self.name), "Heloooooooooooo")
-        return Status.SUCCESS
+        self._set(self._key, "Heloooooooooooo")
+        return SUCCESS
 
     def terminate(self, new_status):
         self.logger.debug("%s[MyAction::terminate().terminate()][%s->%s]" % (self.name, self.status, new_status))
@@ -35,17 +35,18 @@ from pybt.behaviours.count import Count
 
 
 def description():
-    content = "Demonstrates context switching with parallels and sequences.\n"
-    content += "\n"
-    content += "A context switching behaviour is run in parallel with a work sequence.\n"
-    content += "Switching the context occurs in the initialise() and terminate() methods\n"
-    content += "of the context switching behaviour. Note that whether the sequence results\n"
-    content += "in failure or success, the context switch behaviour will always call the\n"
-    content += "terminate() method to restore the context. It will also call terminate()\n"
-    content += "to restore the context in the event of a higher priority parent cancelling\n"
-    content += "this parallel subtree.\n"
-    s = content
-    return s
+    content = (
+        "Demonstrates context switching with parallels and sequences.\n"
+        "\n"
+        "A context switching behaviour is run in parallel with a work sequence.\n"
+        "Switching the context occurs in the initialise() and terminate() methods\n"
+        "of the context switching behaviour. Note that whether the sequence results\n"
+        "in failure or success, the context switch behaviour will always call the\n"
+        "terminate() method to restore the context. It will also call terminate()\n"
+        "to restore the context in the event of a higher priority parent cancelling\n"
+        "this parallel subtree.\n"
+    )
+    return content
 
 class ContextSwitch(pybt.behaviour.Behaviour):
     """
@@ -37,12 +37,13 @@ from pybt.visitors.snapshotVisitor import SnapshotVisitor
 
 
 def description():
-    content = "Demonstrates usage of the ascii/unicode display modes.\n"
-    content += "\n"
-    content += "...\n"
-    content += "...\n"
-    s = content
-    return s
+    content = (
+        "Demonstrates usage of the ascii/unicode display modes.\n"
+        "\n"
+        "...\n"
+        "...\n"
+    )
+    return content
 
 def create_root() -> pybt.behaviour.Behaviour:
     """
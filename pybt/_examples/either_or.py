@@ -49,20 +49,21 @@ from pybt.behaviours.behaviours import Running
 
 
 def description(root):
-    content = "A demonstration of the 'either_or' idiom.\n\n"
-    content += "This behaviour tree pattern enables triggering of subtrees\n"
-    content += "with equal priority (first in, first served).\n"
-    content += "\n"
-    content += "EVENTS\n"
-    content += "\n"
-    content += " -  3 : joystick one enabled, task one starts\n"
-    content += " -  5 : task one finishes\n"
-    content += " -  6 : joystick two enabled, task two starts\n"
-    content += " -  7 : joystick one enabled, task one ignored, task two continues\n"
-    content += " -  8 : task two finishes\n"
-    content += "\n"
-    s = content
-    return s
+    content = (
+        "A demonstration of the 'either_or' idiom.\n\n"
+        "This behaviour tree pattern enables triggering of subtrees\n"
+        "with equal priority (first in, first served).\n"
+        "\n"
+        "EVENTS\n"
+        "\n"
+        " -  3 : joystick one enabled, task one starts\n"
+        " -  5 : task one finishes\n"
+        " -  6 : joystick two enabled, task two starts\n"
+        " -  7 : joystick one enabled, task one ignored, task two continues\n"
+        " -  8 : task two finishes\n"
+        "\n"
+    )
+    return content
 
 def pre_tick_handler(behaviour_tree):
     print("\n--------- Run %s ---------\n" % behaviour_tree.count)
@@ -169,6 +170,7 @@ def main():
     behaviour_tree.add_post_tick_handler(functools.partial(post_tick_handler, snapshot_visitor))
     behaviour_tree.visitors.append(snapshot_visitor)
     behaviour_tree.setup(timeout=15)
+    behaviour_tree.freeze()
 
     ####################
     # Tick Tock
@@ -31,12 +31,13 @@ import pybt.console as console
 
 
 def description():
-    content = "Demonstrates a typical day in the life of a behaviour.\n\n"
-    content += "This behaviour will count from 1 to 3 and then reset and repeat. As it does\n"
-    content += "so, it logs and displays the methods as they are called - construction, setup,\n"
-    content += "initialisation, ticking and termination.\n"
-    s = content
-    return s
+    content = (
+        "Demonstrates a typical day in the life of a behaviour.\n\n"
+        "This behaviour will count from 1 to 3 and then reset and repeat. As it does\n"
+        "so, it logs and displays the methods as they are called - construction, setup,\n"
+        "initialisation, ticking and termination.\n"
+    )
+    return content
 
 class Counter(pybt.behaviour.Behaviour):
     """
@@ -49,19 +49,20 @@ from pybt.visitors.displaySnapshotVisitor import DisplaySnapshotVisitor
 
 
 def description(root):
-    content = "A demonstration of logging with trees.\n\n"
-    content += "This demo utilises a SnapshotVisitor to trigger\n"
-    content += "a post-tick handler to dump a serialisation of the\n"
-    content += "tree to a json log file.\n"
-    content += "\n"
-    content += "This coupling of visitor and post-tick handler can be\n"
-    content += "used for any kind of event handling - the visitor is the\n"
-    content += "trigger and the post-tick handler the action. Aside from\n"
-    content += "logging, the most common use case is to serialise the tree\n"
-    content += "for messaging to a graphical, runtime monitor.\n"
-    content += "\n"
-    s = content
-    return s
+    content = (
+        "A demonstration of logging with trees.\n\n"
+        "This demo utilises a SnapshotVisitor to trigger\n"
+        "a post-tick handler to dump a serialisation of the\n"
+        "tree to a json log file.\n"
+        "\n"
+        "This coupling of visitor and post-tick handler can be\n"
+        "used for any kind of event handling - the visitor is the\n"
+        "trigger and the post-tick handler the action. Aside from\n"
+        "logging, the most common use case is to serialise the tree\n"
+        "for messaging to a graphical, runtime monitor.\n"
+        "\n"
+    )
+    return content
 
 def logger(snapshot_visitor, behaviour_tree):
     """
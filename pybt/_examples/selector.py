@@ -36,13 +36,14 @@ from pybt.behaviours.behaviours import Running
 
 
 def description():
-    content = "Higher priority switching and interruption in the children of a selector.\n"
-    content += "\n"
-    content += "In this example the higher priority child is setup to fail initially,\n"
-    content += "falling back to the continually running second child. On the third\n"
-    content += "tick, the first child succeeds and cancels the hitherto running child.\n"
-    s = content
-    return s
+    content = (
+        "Higher priority switching and interruption in the children of a selector.\n"
+        "\n"
+        "In this example the higher priority child is setup to fail initially,\n"
+        "falling back to the continually running second child. On the third\n"
+        "tick, the first child succeeds and cancels the hitherto running child.\n"
+    )
+    return content
 
 def create_root():
     root = Selector("Selector")
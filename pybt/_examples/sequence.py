@@ -34,11 +34,12 @@ from pybt.nodes.sequence import Sequence
 
 
 def description():
-    content = "Demonstrates sequences in action.\n\n"
-    content += "A sequence is populated with 2-tick jobs that are allowed to run through to\n"
-    content += "completion.\n"
-    s = content
-    return s
+    content = (
+        "Demonstrates sequences in action.\n\n"
+        "A sequence is populated with 2-tick jobs that are allowed to run through to\n"
+        "completion.\n"
+    )
+    return content
 
 def create_root():
     root = Sequence("Sequence", memory=True)
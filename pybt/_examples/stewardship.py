@@ -41,20 +41,21 @@ from pybt.nodes.selector import Selector
 
 
 def description():
-    content = "A demonstration of tree stewardship.\n\n"
-    content += "A slightly less trivial tree that uses a simple stdout pre-tick handler\n"
-    content += "and both the debug and snapshot visitors for logging and displaying\n"
-    content += "the state of the tree.\n"
-    content += "\n"
-    content += "EVENTS\n"
-    content += "\n"
-    content += " -  3 : sequence switches from running to success\n"
-    content += " -  4 : selector's first child flicks to success once only\n"
-    content += " -  8 : the fallback idler kicks in as everything else fails\n"
-    content += " - 14 : the first child kicks in again, aborting a running sequence behind it\n"
-    content += "\n"
-    s = content
-    return s
+    content = (
+        "A demonstration of tree stewardship.\n\n"
+        "A slightly less trivial tree that uses a simple stdout pre-tick handler\n"
+        "and both the debug and snapshot visitors for logging and displaying\n"
+        "the state of the tree.\n"
+        "\n"
+        "EVENTS\n"
+        "\n"
+        " -  3 : sequence switches from running to success\n"
+        " -  4 : selector's first child flicks to success once only\n"
+        " -  8 : the fallback idler kicks in as everything else fails\n"
+        " - 14 : the first child kicks in again, aborting a running sequence behind it\n"
+        "\n"
+    )
+    return content
 
 def pre_tick_handler(behaviour_tree):
     print("\n--------- Run %s ---------\n" % behaviour_tree.count)
@@ -141,6 +142,7 @@ def main():
             display_activity_stream=True)
     )
     behaviour_tree.setup(timeout=15)
+    behaviour_tree.freeze()
 
     ####################
     # Tick Tock
@@ -3,16 +3,44 @@ import typing
 from .. import blackboard as bb
 
 class IntermediateVariableFetcher(object):
+    """
+    Relays attribute style access on a namespace of a blackboard client
+    (e.g. ``client.parameters.speed``) to the client itself.
+
+    Args:
+        blackboard: the client to relay to
+        namespace: the namespace this fetcher resolves names relative to
+    """
+    __slots__ = ('blackboard', 'namespace', '_absolute_name')
+
     def __init__(self, blackboard, namespace):
-        super().__setattr__("blackboard", blackboard)
-        super().__setattr__("namespace", namespace)
+        object.__setattr__(self, "blackboard", blackboard)
+        object.__setattr__(self, "namespace", namespace)
+        object.__setattr__(self, "_absolute_name", bb.Blackboard.absolute_name)
+
+    def _get(self, name: str) -> typing.Any:
+        """
+        Get a variable relative to this fetcher's namespace. Private, so
+        only the slots can shadow a variable of the namespace.
+
+        Args:
+            name: name of the variable to get
+        """
+        return self.blackboard.get(self._absolute_name(self.namespace, name))
+
+    def _set(self, name: str, value: typing.Any) -> bool:
+        """
+        Set a variable relative to this fetcher's namespace.
+
+        Args:
+            name: name of the variable to set
+            value: value of the variable to set
+        """
+        return self.blackboard.set(self._absolute_name(self.namespace, name), value)
 
     def __getattr__(self, name: str):
-        # print("Fetcher:__getattr__ [{}]".format(name))
-        name = bb.Blackboard.absolute_name(self.namespace, name)
-        return self.blackboard.get(name)
+        # only reached for names that are not slots/methods
+        return self._get(name)
 
     def __setattr__(self, name: str, value: typing.Any):
-        # print("Fetcher:__setattr__ [{}][{}]".format(name, value))
-        name = bb.Blackboard.absolute_name(self.namespace, name)
-        return self.blackboard.set(name, value)
\ No newline at end of file
+        self._set(name, value)
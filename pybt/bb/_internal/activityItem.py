@@ -13,6 +13,15 @@ class ActivityItem(object):
         previous_value: of the given key (None if this field is not relevant)
         current_value: current value for the given key (None if this field is not relevant)
     """
+    __slots__ = (
+        'key',
+        'client_name',
+        'client_id',
+        'activity_type',
+        'previous_value',
+        'current_value',
+    )
+
     def __init__(
             self,
             key,
@@ -1,3 +1,5 @@
+import collections
+
 from .activityItem import ActivityItem
 
 class ActivityStream(object):
@@ -6,33 +8,27 @@ class ActivityStream(object):
     activity stream.
 
     Attributes:
-        data (typing.List[ActivityItem]: list of activity items, earliest first
-        maximum_size (int): pop items if this size is exceeded
+        data (typing.Deque[ActivityItem]: bounded queue of activity items, earliest first
+        maximum_size (int): the oldest items are dropped if this size is exceeded
+        push (typing.Callable[[ActivityItem], None]): append the next activity item to the stream
     """
+    __slots__ = ('data', 'maximum_size', 'push')
 
     def __init__(self, maximum_size: int=500):
         """
         Initialise the stream with a maximum storage limit.
 
         Args:
-            maximum_size: pop items from the stream if this size is exceeded
+            maximum_size: drop the oldest items from the stream if this size is exceeded
         """
-        self.data = []
+        self.data = collections.deque(maxlen=maximum_size)
         self.maximum_size = maximum_size
-
-    def push(self, activity_item: ActivityItem):
-        """
-        Push the next activity item to the stream.
-
-        Args:
-            activity_item: new item to append to the stream
-        """
-        if len(self.data) > self.maximum_size:
-            self.data.pop()
-        self.data.append(activity_item)
+        # pushing is the deque's own append, no python frame per recorded
+        # activity, and the deque evicts the oldest item once it is full
+        self.push = self.data.append
 
     def clear(self):
         """
         Delete all activities from the stream.
         """
-        self.data = []
\ No newline at end of file
+        self.data.clear()
\ No newline at end of file
@@ -62,14 +62,27 @@ A high-level list of existing / planned features:
 # Imports
 ##############################################################################
 
-import operator
+from __future__ import annotations
+
+import functools
 import re
 import typing
 import uuid
 
+from .. import utilities
 from ._internal.activityStream import ActivityStream
 from ._internal.keyMetaData import KeyMetaData
 
+##############################################################################
+# Helpers
+##############################################################################
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(regex: str) -> re.Pattern:
+    # introspection tools tend to filter with the same few patterns every tick
+    return re.compile(regex)
+
 ##############################################################################
 # Classes
 ##############################################################################
@@ -92,6 +105,7 @@ class Blackboard(object):
     storage = {}  # key-value storage
     metadata = {}  # key-metadata information
     clients = {}   # client id-name pairs
+    _client_index = {}  # client id -> keys it is registered on (mirrors metadata)
     activity_stream = None
     separator = "/"
 
@@ -125,15 +139,14 @@ class Blackboard(object):
         Return:
             The stored value for the given variable
         """
-        variable_name = Blackboard.absolute_name(Blackboard.separator, variable_name)
-        name_components = variable_name.split('.')
-        key = name_components[0]
-        key_attributes = '.'.join(name_components[1:])
+        if not variable_name.startswith(Blackboard.separator):
+            variable_name = Blackboard.absolute_name(Blackboard.separator, variable_name)
+        key, key_attributes = utilities.split_variable_name(variable_name)
         # can raise KeyError
         value = Blackboard.storage[key]
         if key_attributes:
             try:
-                value = operator.attrgetter(key_attributes)(value)
+                value = utilities.attribute_getter(key_attributes)(value)
             except AttributeError:
                 raise KeyError("Key exists, but does not have the specified nested attributes [{}]".format(variable_name))
         return value
@@ -153,10 +166,9 @@ class Blackboard(object):
         Raises:
             AttributeError: if it is attempting to set a nested attribute tha does not exist.
         """
-        variable_name = Blackboard.absolute_name(Blackboard.separator, variable_name)
-        name_components = variable_name.split('.')
-        key = name_components[0]
-        key_attributes = '.'.join(name_components[1:])
+        if not variable_name.startswith(Blackboard.separator):
+            variable_name = Blackboard.absolute_name(Blackboard.separator, variable_name)
+        key, key_attributes = utilities.split_variable_name(variable_name)
         if not key_attributes:
             Blackboard.storage[key] = value
         else:
@@ -176,7 +188,8 @@ class Blackboard(object):
             True if the variable was removed, False if it was already absent
         """
         try:
-            key = Blackboard.absolute_name(Blackboard.separator, key)
+            if not key.startswith(Blackboard.separator):
+                key = Blackboard.absolute_name(Blackboard.separator, key)
             del Blackboard.storage[key]
             return True
         except KeyError:
@@ -194,24 +207,24 @@ class Blackboard(object):
             AttributeError: if the client does not have read access to the variable
         """
         try:
-            name = Blackboard.absolute_name(Blackboard.separator, name)
+            # get() takes care of making the name absolute
             unused_value = Blackboard.get(name)
             return True
         except KeyError:
             return False
 
     @staticmethod
-    def keys_filtered_by_regex(regex: str) -> typing.Set[str]:
+    def keys_filtered_by_regex(regex: typing.Union[str, re.Pattern]) -> typing.Set[str]:
         """
         Get the set of blackboard keys filtered by regex.
 
         Args:
-            regex: a python regex string
+            regex: a python regex string or an already compiled pattern
 
         Returns:
             subset of keys that have been registered and match the pattern
         """
-        pattern = re.compile(regex)
+        pattern = regex if isinstance(regex, re.Pattern) else _compile(regex)
         return {key for key in Blackboard.metadata.keys() if pattern.search(key) is not None}
 
     @staticmethod
@@ -227,20 +240,9 @@ class Blackboard(object):
         Returns:
             subset of keys that have been registered by the specified clients
         """
-        # forgive users if they sent a list instead of a set
-        if isinstance(client_ids, list):
-            client_ids = set(client_ids)
-        keys = set()
-        for key in Blackboard.metadata.keys():
-            # for sets, | is union, & is intersection
-            key_clients = (
-                set(Blackboard.metadata[key].read) |
-                set(Blackboard.metadata[key].write) |
-                set(Blackboard.metadata[key].exclusive)
-            )
-            if key_clients & client_ids:
-                keys.add(key)
-        return keys
+        # lists are fine too, duplicates just get merged in the union
+        client_index = Blackboard._client_index
+        return set().union(*(client_index.get(client_id, ()) for client_id in client_ids))
 
     @staticmethod
     def enable_activity_stream(maximum_size: int=500):
@@ -274,9 +276,14 @@ class Blackboard(object):
         Blackboard.storage.clear()
         Blackboard.metadata.clear()
         Blackboard.clients.clear()
+        Blackboard._client_index.clear()
         Blackboard.activity_stream = None
+        # pure functions of their arguments, but don't hold on to a cleared board's names
+        Blackboard.absolute_name.cache_clear()
+        Blackboard.relative_name.cache_clear()
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def absolute_name(namespace: str, key: str) -> str:
         """
         Generate the fully qualified key name from namespace and name arguments.
@@ -303,8 +310,8 @@ class Blackboard(object):
         .. warning::
 
             To expedite the method call (it's used with high frequency
-            in blackboard key lookups), no checks are made to ensure
-            the namespace argument leads with a "/". Nor does it check
+            in blackboard key lookups), results are memoised and no checks
+            are made to ensure the namespace argument leads with a "/". Nor does it check
             that a name in absolute form is actually embedded in the
             specified namespace, it just returns the given (absolute)
             name directly.
@@ -318,6 +325,7 @@ class Blackboard(object):
         return "{}{}".format(namespace, key)
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def relative_name(namespace: str, key: str) -> str:
         """
         **Examples**
@@ -344,8 +352,8 @@ class Blackboard(object):
         .. warning::
 
             To expedite the method call (it's used with high frequency
-            in blackboard key lookups), no checks are made to ensure
-            the namespace argument leads with a "/"
+            in blackboard key lookups), results are memoised and no checks
+            are made to ensure the namespace argument leads with a "/"
         """
         # it's already relative
         if not key.startswith(Blackboard.separator):
@@ -373,9 +381,7 @@ class Blackboard(object):
         Returns:
             name of the underlying key
         """
-        name_components = variable_name.split('.')
-        key = name_components[0]
-        return key
+        return variable_name.partition('.')[0]
 
     @staticmethod
     def key_with_attributes(variable_name: str) -> typing.Tuple[str, str]:
@@ -391,7 +397,5 @@ class Blackboard(object):
         Returns:
             a tuple consisting of the key and it's attributes (in string form)
         """
-        name_components = variable_name.split('.')
-        key = name_components[0]
-        key_attributes = '.'.join(name_components[1:])
+        key, key_attributes = utilities.split_variable_name(variable_name)
         return (key, key_attributes)
\ No newline at end of file
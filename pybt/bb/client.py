@@ -1,6 +1,6 @@
+import functools
 import typing
 import uuid
-import operator
 import itertools
 
 from .. import common
@@ -460,10 +460,42 @@ class Client(object):
             AttributeError: if the client does not have write access to the variable
             KeyError: if the variable does not yet exist on the blackboard
         """
+        key, key_attributes = self._resolve_name(name)
+        return self._set_resolved(key, key_attributes, value, overwrite)
+
+    def prepare_write(self, name: str) -> typing.Callable[..., bool]:
+        """
+        Resolve the name of a variable once for callers that repeatedly
+        write to it (e.g. a behaviour on every tick). Access checks are
+        still made on every write.
+
+        .. code-block:: python
+
+            write = blackboard.prepare_write("battery.percentage")
+            write(54.0)
+            write(53.0, overwrite=False)
+
+        Args:
+            name: name of the variable to set, may be nested, e.g. battery.percentage
+
+        Returns:
+            a callable taking (value, overwrite=True) with the same semantics as :meth:`set`
+        """
+        key, key_attributes = self._resolve_name(name)
+        return functools.partial(self._set_resolved, key, key_attributes)
+
+    def _resolve_name(self, name: str) -> typing.Tuple[str, str]:
+        """
+        Split a (possibly nested) variable name into its absolute key and
+        the trailing attributes (empty string if not nested).
+        """
         name = Blackboard.absolute_name(super().__getattribute__("namespace"), name)
-        name_components = name.split('.')
-        key = name_components[0]
-        key_attributes = '.'.join(name_components[1:])
+        return utilities.split_variable_name(name)
+
+    def _set_resolved(self, key: str, key_attributes: str, value: typing.Any, overwrite: bool=True) -> bool:
+        """
+        Worker for :meth:`set` operating on an already resolved name.
+        """
         if (
             (key not in super().__getattribute__("write")) and
             (key not in super().__getattribute__("exclusive"))
@@ -472,6 +504,7 @@ class Client(object):
                 Blackboard.activity_stream.push(
                     self._generate_activity_item(key, ActivityType.ACCESS_DENIED)
                 )
+            name = key + '.' + key_attributes if key_attributes else key
             raise AttributeError("client '{}' does not have write access to '{}'".format(self.name, name))
         remapped_key = super().__getattribute__("remappings")[key]
         if not overwrite:
@@ -511,6 +544,24 @@ class Client(object):
         except KeyError:
             return False
 
+    def __contains__(self, name: str) -> bool:
+        """
+        Check if a variable this client is registered for is on the blackboard.
+        Unlike :meth:`exists`, this neither raises nor records activity and
+        does not look at nested attributes, e.g. ``'battery' in client``.
+
+        Args:
+            name: name of the variable to check for
+        """
+        key = Blackboard.absolute_name(super().__getattribute__("namespace"), name)
+        if (
+            (key not in super().__getattribute__("read")) and
+            (key not in super().__getattribute__("write")) and
+            (key not in super().__getattribute__("exclusive"))
+        ):
+            return False
+        return super().__getattribute__("remappings")[key] in Blackboard.storage
+
     def absolute_name(self, key: str) -> str:
         """
         Generate the fully qualified key name for this key.
@@ -552,17 +603,47 @@ class Client(object):
             KeyError: if the variable or it's nested attributes do not yet exist on the blackboard
         """
         # key attributes is an empty string if not a nested variable name
-        name_components = name.split('.')
-        key = name_components[0]
-        key_attributes = '.'.join(name_components[1:])
+        key, key_attributes = utilities.split_variable_name(name)
         value = getattr(self, key)  # will run through client access checks in __getattr__
         if key_attributes:
             try:
-                value = operator.attrgetter(key_attributes)(value)
+                value = utilities.attribute_getter(key_attributes)(value)
             except AttributeError:
                 raise KeyError("Key exists, but does not have the specified nested attributes [{}]".format(name))
         return value
 
+    def prepare_read(self, name: str) -> typing.Callable[[], typing.Any]:
+        """
+        Resolve the name of a variable once for callers that repeatedly
+        read it (e.g. a behaviour on every tick). Access checks and activity
+        recording still happen on every read.
+
+        .. code-block:: python
+
+            read = blackboard.prepare_read("battery.percentage")
+            percentage = read()
+
+        Args:
+            name: name of the variable to get, may be nested, e.g. battery.percentage
+
+        Returns:
+            a callable taking no arguments with the same semantics as :meth:`get`
+        """
+        key, key_attributes = utilities.split_variable_name(name)
+        if not key_attributes:
+            return functools.partial(getattr, self, key)
+        return functools.partial(self._get_nested, key, utilities.attribute_getter(key_attributes), name)
+
+    def _get_nested(self, key: str, get_attributes: typing.Callable[[typing.Any], typing.Any], name: str) -> typing.Any:
+        """
+        Worker for :meth:`prepare_read` on nested variable names.
+        """
+        value = getattr(self, key)  # will run through client access checks in __getattr__
+        try:
+            return get_attributes(value)
+        except AttributeError:
+            raise KeyError("Key exists, but does not have the specified nested attributes [{}]".format(name))
+
     def unset(self, key: str):
         """
         For when you need to completely remove a blackboard variable (key-value pair),
@@ -675,6 +756,7 @@ class Client(object):
         """
         self.unregister_all_keys(clear)
         del Blackboard.clients[super().__getattribute__("unique_identifier")]
+        Blackboard._client_index.pop(super().__getattribute__("unique_identifier"), None)
 
     def unregister_all_keys(self, clear: bool=True):
         """
@@ -796,10 +878,57 @@ class Client(object):
             Blackboard.metadata[remapped_key].exclusive.add(super().__getattribute__("unique_identifier"))
         else:
             raise TypeError("access argument is of incorrect type [{}]".format(type(access)))
+        Blackboard._client_index.setdefault(
+            super().__getattribute__("unique_identifier"), set()
+        ).add(remapped_key)
         if required:
             super().__getattribute__("required").add(key)
         self._update_namespaces(added_key=key)
 
+    def register_keys(
+            self,
+            keys: typing.Iterable[str],
+            access: common.Access,
+            required: bool=False,
+    ):
+        """
+        Register several keys with the same access on the blackboard, e.g. all
+        the variables a behaviour reads. Read access can't conflict with other
+        clients, so those are registered in a single pass, other accesses are
+        relayed to :meth:`register_key` one at a time.
+
+        Args:
+            keys: keys to register
+            access: access level (read, write, exclusive write)
+            required: if true, check keys exist when calling
+                :meth:`~verify_required_keys_exist`
+
+        Raises:
+            AttributeError if exclusive write access is requested, but write access has already been given to another client
+            TypeError if the access argument is of incorrect type
+        """
+        if access != common.Access.READ:
+            for key in keys:
+                self.register_key(key=key, access=access, required=required)
+            return
+        namespace = super().__getattribute__("namespace")
+        remappings = super().__getattribute__("remappings")
+        read = super().__getattribute__("read")
+        unique_identifier = super().__getattribute__("unique_identifier")
+        client_keys = Blackboard._client_index.setdefault(unique_identifier, set())
+        for key in keys:
+            key = Blackboard.absolute_name(namespace, key)
+            remappings[key] = key
+            read.add(key)
+            key_metadata = Blackboard.metadata.get(key)
+            if key_metadata is None:
+                key_metadata = Blackboard.metadata[key] = KeyMetaData()
+            key_metadata.read.add(unique_identifier)
+            client_keys.add(key)
+            if required:
+                super().__getattribute__("required").add(key)
+            self._update_namespaces(added_key=key)
+
     def unregister_key(
             self,
             key: str,
@@ -826,6 +955,7 @@ class Client(object):
         Blackboard.metadata[remapped_key].read.discard(super().__getattribute__("unique_identifier"))
         Blackboard.metadata[remapped_key].write.discard(super().__getattribute__("unique_identifier"))
         Blackboard.metadata[remapped_key].exclusive.discard(super().__getattribute__("unique_identifier"))
+        Blackboard._client_index[super().__getattribute__("unique_identifier")].discard(remapped_key)
         if (
             (not Blackboard.metadata[remapped_key].read) and
             (not Blackboard.metadata[remapped_key].write) and
@@ -16,6 +16,7 @@ from this class.
 # Imports
 ##############################################################################
 
+import collections
 import re
 import typing
 import uuid
@@ -51,6 +52,7 @@ class Behaviour(object):
         ~py_trees.behaviours.Behaviour.logger (:class:`logging.Logger`): a simple logging mechanism
         ~py_trees.behaviours.Behaviour.feedback_message(:obj:`str`): improve debugging with a simple message
         ~py_trees.behaviours.Behaviour.blackbox_level (:class:`~py_trees.common.BlackBoxLevel`): a helper variable for dot graphs and runtime gui's to collapse/explode entire subtrees dependent upon the blackbox level.
+        ~py_trees.behaviours.Behaviour.tick_every_n (:obj:`int`): only call :meth:`~py_trees.behaviour.Behaviour.update` on every n'th tick, in between the last status is reused (defaults to 1, i.e. every tick, see :meth:`~py_trees.behaviour.Behaviour.tick_once_leaf`)
 
     .. seealso::
        * :ref:`Skeleton Behaviour Template <skeleton-behaviour-include>`
@@ -58,6 +60,25 @@ class Behaviour(object):
        * :ref:`The Action Behaviour Demo <py-trees-demo-action-behaviour-program>`
 
     """
+    # subclasses that don't declare their own __slots__ still get a __dict__
+    __slots__ = (
+        'id',
+        'name',
+        'blackboards',
+        'qualified_name',
+        'status',
+        '_iterator',
+        'parent',
+        'children',
+        'logger',
+        'feedback_message',
+        'blackbox_level',
+        '_is_leaf',
+        '_tick_every_n',
+        '_tick_counter',
+        '_throttled_status',
+    )
+
     def __init__(
         self,
         name: typing.Union[str, common.Name]=common.Name.AUTO_GENERATED
@@ -71,12 +92,55 @@ class Behaviour(object):
         self.blackboards = [] #List[blackboard.Client]
         self.qualified_name = "{}/{}".format(self.__class__.__qualname__, self.name)  # convenience
         self.status = common.Status.INVALID
-        self.iterator = self.tick()
+        self.iterator = None  # created lazily, see the iterator property
         self.parent = None  # will get set if a behaviour is added to a composite
         self.children = []  # only set by composite behaviours
         self.logger = logging.Logger(name)
         self.feedback_message = ""  # useful for debugging, or human readable updates, but not necessary to implement
         self.blackbox_level = common.BlackBoxLevel.NOT_A_BLACKBOX
+        # composites tick these through tick_once_leaf(), skipping the generator
+        self._is_leaf = type(self).tick is Behaviour.tick
+        # opt-in throttling for behaviours whose result rarely changes
+        self._tick_every_n = 1
+        self._tick_counter = 0
+        self._throttled_status = None  # result of the last update() when throttling
+
+    @property
+    def iterator(self):
+        """
+        Generator for the next :meth:`tick`. Stopping a behaviour discards it and
+        a fresh one is only created when it's asked for again.
+        """
+        if self._iterator is None:
+            self._iterator = self.tick()
+        return self._iterator
+
+    @iterator.setter
+    def iterator(self, iterator):
+        self._iterator = iterator
+
+    @property
+    def tick_every_n(self):
+        """
+        Only call :meth:`update` on every n'th tick, see :meth:`tick_once_leaf`.
+        Only applies to behaviours that don't override :meth:`tick`, i.e. not to
+        composites or decorators.
+
+        Raises:
+            ValueError: if n is not a positive integer
+            TypeError: if throttling is requested for a behaviour that overrides :meth:`tick`
+        """
+        return self._tick_every_n
+
+    @tick_every_n.setter
+    def tick_every_n(self, n):
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("tick_every_n must be a positive integer [{}]".format(n))
+        if n != 1 and not self._is_leaf:
+            raise TypeError("tick_every_n only applies to behaviours that don't override tick() [{}]".format(self.name))
+        self._tick_every_n = n
+        self._tick_counter = 0
+        self._throttled_status = None
 
     ############################################
     # User Customisable Callbacks
@@ -238,8 +302,8 @@ class Behaviour(object):
         using the generator mechanism.
         """
         # no logger necessary here...it directly relays to tick
-        for unused in self.tick():
-            pass
+        # (a zero length deque exhausts the generator without a python level loop)
+        collections.deque(self.tick(), maxlen=0)
 
     def tick(self):
         """
@@ -267,18 +331,49 @@ class Behaviour(object):
         .. warning:: Override this method only in exceptional circumstances, prefer overriding :meth:`~py_trees.behaviour.Behaviour.update` instead.
 
         """
-        self.logger.debug("%s.tick()" % (self.__class__.__name__))
-        if self.status != common.Status.RUNNING:
+        self.tick_once_leaf()
+        yield self
+
+    def tick_once_leaf(self):
+        """
+        The work of a single :meth:`tick` without the generator, used by composites
+        to tick behaviours that don't override :meth:`tick`.
+
+        If :attr:`tick_every_n` is greater than one, only every n'th tick does
+        any work (initialise, update, terminate), the others restore the status
+        returned by the last :meth:`update`. This survives parents invalidating
+        their children between ticks (e.g. a sequence without memory), except
+        for a :data:`~py_trees.common.Status.RUNNING` behaviour that was
+        interrupted, which is always updated again.
+
+        Returns:
+            :class:`~py_trees.common.Status`: the new status of the behaviour
+        """
+        if self._tick_every_n != 1:
+            throttled_status = self._throttled_status
+            if throttled_status is not None and (
+                throttled_status is not common.Status.RUNNING or self.status is common.Status.RUNNING
+            ):
+                self._tick_counter += 1
+                if self._tick_counter < self._tick_every_n:
+                    self.status = throttled_status
+                    return throttled_status
+            self._tick_counter = 0
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick()", self.__class__.__name__)
+        if self.status is not common.Status.RUNNING:
             self.initialise()
         # don't set self.status yet, terminate() may need to check what the current state is first
         new_status = self.update()
-        if new_status not in list(common.Status):
+        if not isinstance(new_status, common.Status):
             self.logger.error("A behaviour returned an invalid status, setting to INVALID [%s][%s]" % (new_status, self.name))
             new_status = common.Status.INVALID
-        if new_status != common.Status.RUNNING:
+        if new_status is not common.Status.RUNNING:
             self.stop(new_status)
         self.status = new_status
-        yield self
+        if self._tick_every_n != 1:
+            self._throttled_status = None if new_status is common.Status.INVALID else new_status
+        return new_status
 
     def iterate(self, direct_descendants=False):
         """
@@ -298,8 +393,7 @@ class Behaviour(object):
         """
         for child in self.children:
             if not direct_descendants:
-                for node in child.iterate():
-                    yield node
+                yield from child.iterate()
             else:
                 yield child
         yield self
@@ -325,10 +419,14 @@ class Behaviour(object):
 
         .. warning:: Override this method only in exceptional circumstances, prefer overriding :meth:`~py_trees.behaviour.Behaviour.terminate` instead.
         """
-        self.logger.debug("%s.stop(%s)" % (self.__class__.__name__, "%s->%s" % (self.status, new_status) if self.status != new_status else "%s" % new_status))
+        if logging.level < logging.INFO:
+            if self.status != new_status:
+                self.logger.debug("%s.stop(%s->%s)", self.__class__.__name__, self.status, new_status)
+            else:
+                self.logger.debug("%s.stop(%s)", self.__class__.__name__, new_status)
         self.terminate(new_status)
         self.status = new_status
-        self.iterator = self.tick()
+        self.iterator = None
 
     ############################################
     # Public - introspection API
@@ -13,17 +13,34 @@ This is the top-level namespace of the py_trees package.
 # Imports
 ##############################################################################
 
-from . import behaviours # noqa
-from . import blackboardToStatus # noqa
-from . import checkBlackboardVariableExists # noqa
-from . import checkBlackboardVariableValue # noqa
-from . import checkBlackboardVariableValues # noqa
-from . import count # noqa 
-from . import periodic # noqa
-from . import setBlackboardVariable # noqa
-from . import statusSequence # noqa
-from . import successEveryN # noqa
-from . import tickCounter # noqa
-from . import unsetBlackboardVariable # noqa
-from . import waitForBlackboardVariable # noqa
-from . import waitForBlackboardVariableValue # noqa
\ No newline at end of file
+import importlib
+
+# submodules are imported on first access (PEP 562) rather than at package load
+_submodules = (
+    "behaviours",
+    "blackboardToStatus",
+    "checkBlackboardVariableExists",
+    "checkBlackboardVariableValue",
+    "checkBlackboardVariableValues",
+    "count",
+    "periodic",
+    "setBlackboardVariable",
+    "statusSequence",
+    "successEveryN",
+    "tickCounter",
+    "unsetBlackboardVariable",
+    "waitForBlackboardVariable",
+    "waitForBlackboardVariableValue",
+)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        module = importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
@@ -15,6 +15,7 @@ A library of fundamental behaviours for use.
 ##############################################################################
 
 from .. import common
+from .. import logging
 from .. import meta
 
 ##############################################################################
@@ -22,27 +23,31 @@ from .. import meta
 ##############################################################################
 
 def success(self):
-    self.logger.debug("%s.update()" % self.__class__.__name__)
+    if logging.level < logging.INFO:
+        self.logger.debug("%s.update()", self.__class__.__name__)
     self.feedback_message = "success"
-    return common.Status.SUCCESS
+    return common.SUCCESS
 
 
 def failure(self):
-    self.logger.debug("%s.update()" % self.__class__.__name__)
+    if logging.level < logging.INFO:
+        self.logger.debug("%s.update()", self.__class__.__name__)
     self.feedback_message = "failure"
-    return common.Status.FAILURE
+    return common.FAILURE
 
 
 def running(self):
-    self.logger.debug("%s.update()" % self.__class__.__name__)
+    if logging.level < logging.INFO:
+        self.logger.debug("%s.update()", self.__class__.__name__)
     self.feedback_message = "running"
-    return common.Status.RUNNING
+    return common.RUNNING
 
 
 def dummy(self):
-    self.logger.debug("%s.update()" % self.__class__.__name__)
+    if logging.level < logging.INFO:
+        self.logger.debug("%s.update()", self.__class__.__name__)
     self.feedback_message = "crash test dummy"
-    return common.Status.RUNNING
+    return common.RUNNING
 
 
 Success = meta.create_behaviour_from_function(success)
@@ -2,6 +2,10 @@ import typing
 
 from .. import common
 from .. import behaviour
+from .. import logging
+from .. import utilities
+
+_Status = common.Status
 
 class BlackboardToStatus(behaviour.Behaviour):
     """
@@ -26,16 +30,18 @@ class BlackboardToStatus(behaviour.Behaviour):
         KeyError: if the variable doesn't exist
         TypeError: if the variable isn't of type :py:data:`~py_trees.common.Status`
     """
+    __slots__ = ('blackboard', 'key', 'key_attributes', 'variable_name', '_feedback_prefix')
+
     def __init__(
         self,
         variable_name: str,
         name: typing.Union[str, common.Name]=common.Name.AUTO_GENERATED
     ):
         super().__init__(name=name)
-        name_components = variable_name.split('.')
-        self.key = name_components[0]
-        self.key_attributes = '.'.join(name_components[1:])  # empty string if no other parts
+        # key_attributes is an empty string if not nested
+        self.key, self.key_attributes = utilities.split_variable_name(variable_name)
         self.variable_name = variable_name
+        self._feedback_prefix = variable_name + ": "
         self.blackboard = self.attach_blackboard_client()
         self.blackboard.register_key(key=self.key, access=common.Access.READ)
 
@@ -46,10 +52,12 @@ class BlackboardToStatus(behaviour.Behaviour):
         Returns:
              :data:`~py_trees.common.Status.SUCCESS` if key found, :data:`~py_trees.common.Status.FAILURE` otherwise.
         """
-        self.logger.debug("%s.update()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()", self.__class__.__name__)
         # raises a KeyError if the variable doesn't exist
         status = self.blackboard.get(self.variable_name)
-        if type(status) != common.Status:
+        # enums with members can't be subclassed, so this is an exact type check
+        if status.__class__ is not _Status:
             raise TypeError("{0} is not of type py_trees.common.Status".format(self.variable_name))
-        self.feedback_message = "{0}: {1}".format(self.variable_name, status)
+        self.feedback_message = self._feedback_prefix + str(status)
         return status
\ No newline at end of file
@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 import typing
 
 from .. import common
 from .. import behaviour
+from .. import logging
+from .. import utilities
 
 class CheckBlackboardVariableExists(behaviour.Behaviour):
     """
@@ -19,6 +23,8 @@ class CheckBlackboardVariableExists(behaviour.Behaviour):
         variable_name: name of the variable look for, may be nested, e.g. battery.percentage
         name: name of the behaviour
     """
+    __slots__ = ('blackboard', 'key', 'key_attributes', 'variable_name', '_read', '_found_message', '_missing_message')
+
     def __init__(
             self,
             variable_name: str,
@@ -26,11 +32,13 @@ class CheckBlackboardVariableExists(behaviour.Behaviour):
     ):
         super().__init__(name=name)
         self.variable_name = variable_name
-        name_components = variable_name.split('.')
-        self.key = name_components[0]
-        self.key_attributes = '.'.join(name_components[1:])  # empty string if no other parts
+        # key_attributes is an empty string if not nested
+        self.key, self.key_attributes = utilities.split_variable_name(variable_name)
         self.blackboard = self.attach_blackboard_client()
         self.blackboard.register_key(key=self.key, access=common.Access.READ)
+        self._read = self.blackboard.prepare_read(variable_name)
+        self._found_message = "variable '{}' found".format(variable_name)
+        self._missing_message = "variable '{}' not found".format(variable_name)
 
     def update(self) -> common.Status:
         """
@@ -39,11 +47,12 @@ class CheckBlackboardVariableExists(behaviour.Behaviour):
         Returns:
              :data:`~py_trees.common.Status.SUCCESS` if key found, :data:`~py_trees.common.Status.FAILURE` otherwise.
         """
-        self.logger.debug("%s.update()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()", self.__class__.__name__)
         try:
-            unused_value = self.blackboard.get(self.variable_name)
-            self.feedback_message = "variable '{}' found".format(self.variable_name)
+            unused_value = self._read()
+            self.feedback_message = self._found_message
             return common.Status.SUCCESS
         except KeyError:
-            self.feedback_message = "variable '{}' not found".format(self.variable_name)
+            self.feedback_message = self._missing_message
             return common.Status.FAILURE
\ No newline at end of file
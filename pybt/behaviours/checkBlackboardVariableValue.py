@@ -1,8 +1,9 @@
 import typing
-import operator
 
 from .. import common
 from .. import behaviour
+from .. import logging
+from .. import utilities
 
 class CheckBlackboardVariableValue(behaviour.Behaviour):
     """
@@ -23,6 +24,8 @@ class CheckBlackboardVariableValue(behaviour.Behaviour):
     .. tip::
         The python `operator module`_ includes many useful comparison operations.
     """
+    __slots__ = ('blackboard', 'check', 'key', 'key_attributes')
+
     def __init__(
             self,
             check: common.ComparisonExpression,
@@ -30,9 +33,8 @@ class CheckBlackboardVariableValue(behaviour.Behaviour):
     ):
         super().__init__(name=name)
         self.check = check
-        name_components = self.check.variable.split('.')
-        self.key = name_components[0]
-        self.key_attributes = '.'.join(name_components[1:])  # empty string if no other parts
+        # key_attributes is an empty string if not nested
+        self.key, self.key_attributes = utilities.split_variable_name(self.check.variable)
         self.blackboard = self.attach_blackboard_client()
         self.blackboard.register_key(key=self.key, access=common.Access.READ)
 
@@ -43,12 +45,13 @@ class CheckBlackboardVariableValue(behaviour.Behaviour):
         Returns:
              :class:`~py_trees.common.Status`: :data:`~py_trees.common.Status.FAILURE` if not matched, :data:`~py_trees.common.Status.SUCCESS` otherwise.
         """
-        self.logger.debug("%s.update()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()", self.__class__.__name__)
         try:
             value = self.blackboard.get(self.key)
             if self.key_attributes:
                 try:
-                    value = operator.attrgetter(self.key_attributes)(value)
+                    value = utilities.attribute_getter(self.key_attributes)(value)
                 except AttributeError:
                     self.feedback_message = 'blackboard key-value pair exists, but the value does not have the requested nested attributes [{}]'.format(self.variable_name)
                     return common.Status.FAILURE
@@ -1,10 +1,23 @@
+from __future__ import annotations
+
 import typing
 import functools
+import operator
 
 from .. import common
 from .. import behaviour
+from .. import logging
 from ..bb import blackboard
 
+# logical operators that can stop at the first check with this (truth) value
+_DECIDING_RESULT = {operator.and_: False, operator.or_: True}
+
+
+@functools.lru_cache(maxsize=256)
+def _feedback_message(truths: typing.Tuple[bool, ...]) -> str:
+    # only 2^n messages for n checks, built once each
+    return "[{}]".format("|".join("T" if truth else "F" for truth in truths))
+
 class CheckBlackboardVariableValues(behaviour.Behaviour):
     """
     Apply a logical operation across a set of blackboard variable checks.
@@ -21,9 +34,17 @@ class CheckBlackboardVariableValues(behaviour.Behaviour):
     .. tip::
         The python `operator module`_ includes many useful logical operators, e.g. operator.xor.
 
+    .. note::
+        Like python's own `and`/`or`, :func:`operator.and_` and :func:`operator.or_`
+        stop at the first check that decides the outcome, later variables are then
+        neither read nor compared. All checks are evaluated when results are
+        stored under a namespace.
+
     Raises:
         ValueError if less than two variable checks are specified (insufficient for logical operations)
     """
+    __slots__ = ('blackboard', 'blackboard_results', 'checks', 'operator', '_readers', '_deciding_result', '_results', '_result_writers')
+
     def __init__(
         self,
         checks: typing.List[common.ComparisonExpression],
@@ -37,12 +58,17 @@ class CheckBlackboardVariableValues(behaviour.Behaviour):
         self.blackboard = self.attach_blackboard_client()
         if len(checks) < 2:
             raise ValueError("Must be at least two variables to operate on [only {} provided]".format(len(checks)))
-        for check in self.checks:
-            self.blackboard.register_key(
-                key=blackboard.Blackboard.key(check.variable),
-                access=common.Access.READ
-            )
+        self.blackboard.register_keys(
+            keys=[blackboard.Blackboard.key(check.variable) for check in self.checks],
+            access=common.Access.READ
+        )
+        # one reader per check, variable names are resolved here rather than every tick
+        self._readers = [self.blackboard.prepare_read(check.variable) for check in self.checks]
+        # scratch list for the results, emptied and refilled on every tick
+        self._results = []
+        self._deciding_result = _DECIDING_RESULT.get(operator) if namespace is None else None
         self.blackboard_results = None
+        self._result_writers = []
         if namespace is not None:
             self.blackboard_results = self.attach_blackboard_client(namespace=namespace)
             for counter in range(1, len(self.checks) + 1):
@@ -50,6 +76,10 @@ class CheckBlackboardVariableValues(behaviour.Behaviour):
                     key=str(counter),
                     access=common.Access.WRITE
                 )
+            self._result_writers = [
+                self.blackboard_results.prepare_write(str(counter))
+                for counter in range(1, len(self.checks) + 1)
+            ]
 
     def update(self) -> common.Status:
         """
@@ -59,26 +89,26 @@ class CheckBlackboardVariableValues(behaviour.Behaviour):
         Returns:
              :data:`~py_trees.common.Status.FAILURE` if key retrieval or logical checks failed, :data:`~py_trees.common.Status.SUCCESS` otherwise.
         """
-        self.logger.debug("%s.update()" % self.__class__.__name__)
-        results = []
-        for check in self.checks:
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()", self.__class__.__name__)
+        results = self._results
+        results.clear()
+        for check, read in zip(self.checks, self._readers):
             try:
-                value = self.blackboard.get(check.variable)
+                value = read()
             except KeyError:
                 self.feedback_message = "variable '{}' does not yet exist on the blackboard".format(check.variable)
                 return common.Status.FAILURE
-            results.append(check.operator(value, check.value))
-        if self.blackboard_results is not None:
-            for counter in range(1, len(results) + 1):
-                self.blackboard_results.set(str(counter), results[counter - 1])
+            result = check.operator(value, check.value)
+            results.append(result)
+            if bool(result) is self._deciding_result:
+                break
+        # only once every variable could be read, so results are stored all or nothing
+        for write, result in zip(self._result_writers, results):
+            write(result)
         logical_result = functools.reduce(self.operator, results)
+        self.feedback_message = _feedback_message(tuple(map(bool, results)))
         if logical_result:
-            self.feedback_message = "[{}]".format(
-                "|".join(["T" if result else "F" for result in results])
-            )
             return common.Status.SUCCESS
         else:
-            self.feedback_message = "[{}]".format(
-                "|".join(["T" if result else "F" for result in results])
-            )
             return common.Status.FAILURE
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .. import common
 from .. import behaviour
+from .. import logging
 
 class Count(behaviour.Behaviour):
     """
@@ -20,6 +21,16 @@ class Count(behaviour.Behaviour):
     Attributes:
         count (:obj:`int`): a simple counter which increments every tick
     """
+    __slots__ = (
+        'count',
+        'fail_until',
+        'running_until',
+        'success_until',
+        'number_count_resets',
+        'number_updated',
+        'reset',
+    )
+
     def __init__(self, name="Count", fail_until=3, running_until=5, success_until=6, reset=True):
         super(Count, self).__init__(name)
         self.count = 0
@@ -31,7 +42,8 @@ class Count(behaviour.Behaviour):
         self.reset = reset
 
     def terminate(self, new_status):
-        self.logger.debug("%s.terminate(%s->%s)" % (self.__class__.__name__, self.status, new_status))
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.terminate(%s->%s)", self.__class__.__name__, self.status, new_status)
         # reset only if udpate got us into an invalid state
         if new_status == common.Status.INVALID and self.reset:
             self.count = 0
@@ -41,22 +53,23 @@ class Count(behaviour.Behaviour):
     def update(self):
         self.number_updated += 1
         self.count += 1
-        if self.count <= self.fail_until:
-            self.logger.debug("%s.update()[%s: failure]" % (self.__class__.__name__, self.count))
+        count = self.count
+        if count <= self.fail_until:
+            status = common.Status.FAILURE
             self.feedback_message = "failing"
-            return common.Status.FAILURE
-        elif self.count <= self.running_until:
-            self.logger.debug("%s.update()[%s: running]" % (self.__class__.__name__, self.count))
+        elif count <= self.running_until:
+            status = common.Status.RUNNING
             self.feedback_message = "running"
-            return common.Status.RUNNING
-        elif self.count <= self.success_until:
-            self.logger.debug("%s.update()[%s: success]" % (self.__class__.__name__, self.count))
+        elif count <= self.success_until:
+            status = common.Status.SUCCESS
             self.feedback_message = "success"
-            return common.Status.SUCCESS
         else:
-            self.logger.debug("%s.update()[%s: failure]" % (self.__class__.__name__, self.count))
+            status = common.Status.FAILURE
             self.feedback_message = "failing forever more"
-            return common.Status.FAILURE
+        # skip building the message when it would just be discarded
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()[%s: %s]", self.__class__.__name__, count, status.value.lower())
+        return status
 
     def __repr__(self):
         """
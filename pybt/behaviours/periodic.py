@@ -16,6 +16,8 @@ class Periodic(behaviour.Behaviour):
 
     .. note:: It does not reset the count when initialising.
     """
+    __slots__ = ('count', 'period', 'response')
+
     def __init__(self, name, n):
         super(Periodic, self).__init__(name)
         self.count = 0
@@ -2,6 +2,7 @@ import typing
 
 from .. import common
 from .. import behaviour
+from .. import utilities
 
 class SetBlackboardVariable(behaviour.Behaviour):
     """
@@ -13,6 +14,18 @@ class SetBlackboardVariable(behaviour.Behaviour):
         overwrite: when False, do not set the variable if it already exists
         name: name of the behaviour
     """
+    __slots__ = (
+        'variable_name',
+        'key',
+        'key_attributes',
+        'blackboard',
+        'variable_value_generator',
+        'overwrite',
+        '_write',
+        '_is_constant',
+        '_constant_value',
+    )
+
     def __init__(
             self,
             variable_name: str,
@@ -22,13 +35,21 @@ class SetBlackboardVariable(behaviour.Behaviour):
     ):
         super().__init__(name=name)
         self.variable_name = variable_name
-        name_components = variable_name.split('.')
-        self.key = name_components[0]
-        self.key_attributes = '.'.join(name_components[1:])  # empty string if no other parts
+        # key_attributes is an empty string if not nested
+        self.key, self.key_attributes = utilities.split_variable_name(variable_name)
         self.blackboard = self.attach_blackboard_client()
         self.blackboard.register_key(key=self.key, access=common.Access.WRITE)
         self.variable_value_generator = variable_value if callable(variable_value) else lambda: variable_value
         self.overwrite = overwrite
+        # resolved once here, update() runs on every tick and overwrite
+        # is fixed at construction, so bake it into the write
+        write = self.blackboard.prepare_write(variable_name)
+        if overwrite:
+            self._write = write
+        else:
+            self._write = lambda value: write(value, False)
+        self._is_constant = not callable(variable_value)
+        self._constant_value = variable_value
 
     def update(self) -> common.Status:
         """
@@ -37,11 +58,8 @@ class SetBlackboardVariable(behaviour.Behaviour):
         Returns:
              :data:`~py_trees.common.Status.FAILURE` if no overwrite requested and the variable exists,  :data:`~py_trees.common.Status.SUCCESS` otherwise
         """
-        if self.blackboard.set(
-            self.variable_name,
-            self.variable_value_generator(),
-            overwrite=self.overwrite
-        ):
-            return common.Status.SUCCESS
+        value = self._constant_value if self._is_constant else self.variable_value_generator()
+        if self._write(value):
+            return common.SUCCESS
         else:
-            return common.Status.FAILURE
\ No newline at end of file
+            return common.FAILURE
\ No newline at end of file
@@ -13,6 +13,8 @@ class StatusSequence(behaviour.Behaviour):
         sequence: list of status values to cycle through
         eventually: status to use eventually, None to re-cycle the sequence
     """
+    __slots__ = ('sequence', 'eventually', 'current_sequence')
+
     def __init__(
             self,
             name: str,
@@ -1,5 +1,9 @@
 from .. import common
 from .. import behaviour
+from .. import logging
+
+_SUCCESS = common.Status.SUCCESS
+_FAILURE = common.Status.FAILURE
 
 class SuccessEveryN(behaviour.Behaviour):
     """
@@ -14,6 +18,8 @@ class SuccessEveryN(behaviour.Behaviour):
        Use with decorators to change the status value as desired, e.g.
        :meth:`py_trees.decorators.FailureIsRunning`
     """
+    __slots__ = ('count', 'every_n')
+
     def __init__(self, name, n):
         super(SuccessEveryN, self).__init__(name)
         self.count = 0
@@ -21,10 +27,11 @@ class SuccessEveryN(behaviour.Behaviour):
 
     def update(self):
         self.count += 1
-        self.logger.debug("%s.update()][%s]" % (self.__class__.__name__, self.count))
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()][%s]", self.__class__.__name__, self.count)
         if self.count % self.every_n == 0:
             self.feedback_message = "now"
-            return common.Status.SUCCESS
+            return _SUCCESS
         else:
             self.feedback_message = "not yet"
-            return common.Status.FAILURE
\ No newline at end of file
+            return _FAILURE
\ No newline at end of file
@@ -16,6 +16,8 @@ class TickCounter(behaviour.Behaviour):
         duration: number of ticks to run
         completion_status: status to switch to once the counter has expired
     """
+    __slots__ = ('completion_status', 'duration', 'counter')
+
     def __init__(
         self,
         duration: int,
@@ -15,6 +15,8 @@ class UnsetBlackboardVariable(behaviour.Behaviour):
         key: unset this key-value pair
         name: name of the behaviour
     """
+    __slots__ = ('blackboard', 'key')
+
     def __init__(self,
                  key: str,
                  name: typing.Union[str, common.Name]=common.Name.AUTO_GENERATED,
@@ -1,6 +1,7 @@
 import typing
 
 from .. import common
+from .. import logging
 from . import checkBlackboardVariableExists as base
 
 class WaitForBlackboardVariable(base.CheckBlackboardVariableExists):
@@ -19,6 +20,8 @@ class WaitForBlackboardVariable(base.CheckBlackboardVariableExists):
         variable_name: name of the variable to wait for, may be nested, e.g. battery.percentage
         name: name of the behaviour
     """
+    __slots__ = ()
+
     def __init__(
             self,
             variable_name: str,
@@ -33,7 +36,8 @@ class WaitForBlackboardVariable(base.CheckBlackboardVariableExists):
         Returns:
              :data:`~py_trees.common.Status.SUCCESS` if key found, :data:`~py_trees.common.Status.RUNNING` otherwise.
         """
-        self.logger.debug("%s.update()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()", self.__class__.__name__)
         new_status = super().update()
         # CheckBlackboardExists only returns SUCCESS || FAILURE
         if new_status == common.Status.SUCCESS:
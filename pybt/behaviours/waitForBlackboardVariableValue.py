@@ -3,6 +3,9 @@ import typing
 from .. import common
 from . import checkBlackboardVariableValue as c
 
+_FAILURE = common.Status.FAILURE
+_RUNNING = common.Status.RUNNING
+
 class WaitForBlackboardVariableValue(c.CheckBlackboardVariableValue):
     """
     Inspect a blackboard variable and if it exists, check that it
@@ -24,6 +27,8 @@ class WaitForBlackboardVariableValue(c.CheckBlackboardVariableValue):
         check: a comparison expression to check against
         name: name of the behaviour
     """
+    __slots__ = ()
+
     def __init__(
             self,
             check: common.ComparisonExpression,
@@ -42,7 +47,7 @@ class WaitForBlackboardVariableValue(c.CheckBlackboardVariableValue):
              :class:`~py_trees.common.Status`: :data:`~py_trees.common.Status.FAILURE` if not matched, :data:`~py_trees.common.Status.SUCCESS` otherwise.
         """
         new_status = super().update()
-        if new_status == common.Status.FAILURE:
-            return common.Status.RUNNING
+        if new_status is _FAILURE:
+            return _RUNNING
         else:
             return new_status
\ No newline at end of file
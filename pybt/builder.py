@@ -1,6 +1,22 @@
 from . import *
 
 class BehaviourTreeBuilder():
+    # Node classes, resolved once when the module is imported
+    _SequenceCls = nodes.sequence.Sequence
+    _SelectorCls = nodes.selector.Selector
+    _ParallelCls = nodes.parallel.Parallel
+    _EternalGuardCls = nodes.eternalGuard.EternalGuard
+    _FailureIsRunningCls = nodes.failureIsRunning.FailureIsRunning
+    _FailureIsSuccessCls = nodes.failureIsSuccess.FailureIsSuccess
+    _RunningIsFailureCls = nodes.runningIsFailure.RunningIsFailure
+    _RunningIsSuccessCls = nodes.runningIsSuccess.RunningIsSuccess
+    _SuccessIsFailureCls = nodes.successIsFailure.SuccessIsFailure
+    _SuccessIsRunningCls = nodes.successIsRunning.SuccessIsRunning
+    _InverterCls = nodes.inverter.Inverter
+    _OneShotCls = nodes.oneshot.OneShot
+    _StatusToBlackboardCls = nodes.statusToBlackboard.StatusToBlackboard
+    _TimeoutCls = nodes.timeout.Timeout
+
     def __init__(self, showDebugs = False):
         self.showDebugs = showDebugs # type: bool
         """Whether to print debug logs in the console"""
@@ -17,7 +33,7 @@ class BehaviourTreeBuilder():
         """The current decorator of the currentNode"""
         pass
 
-    def _internalNodeHandler(self, newNode):
+    def _internalNodeHandler(self, newNode, descend = True):
         """
         Prints the newly added node in the console.
         Adds the passed node as a child of the previous Composite or Decorator.
@@ -25,19 +41,20 @@ class BehaviourTreeBuilder():
 
         Args:
             newNode (:class:`~pybt.behaviour.Behaviour`): The new node to add in the tree
+            descend (:class:`bool`): Whether following nodes are added beneath the new node (False for leaves)
         """
-        self._printNode(newNode)
+        if self.showDebugs:
+            self._printNode(newNode)
 
-        if self._currentNode is None:
-            self._currentNode = newNode
+        currentNode = self._currentNode
+        if currentNode is None:
+            if descend:
+                self._currentNode = newNode
         else:
-            self._parent = self._currentNode
-            if isinstance(self._currentNode, nodes.composite.Composite):
-                self._currentNode.add_child(newNode)
-            elif isinstance(self._currentNode, nodes.decorator.Decorator):
-                self._currentNode.add_decorated(newNode)
-            
-            self._currentNode = newNode
+            currentNode.attach(newNode)
+            if descend:
+                self._parent = currentNode
+                self._currentNode = newNode
 
         if self._root is None:
             self._root = self._currentNode
@@ -53,7 +70,8 @@ class BehaviourTreeBuilder():
         if not self.showDebugs:
             return
 
-        print("Added {0} named {1} -> {2}".format(node.__class__.__name__, node.name, self._currentNode.name if self._currentNode is not None else "None"))
+        parentName = self._currentNode.name if self._currentNode is not None else "None"
+        print(f"Added {node.__class__.__name__} named {node.name} -> {parentName}")
 
 #region ACCESS
     def Root(self):
@@ -81,6 +99,8 @@ class BehaviourTreeBuilder():
 #endregion
 
 #region COMPOSITES
+    # Node constructors below are called positionally (child first for decorators,
+    # which the builder attaches later), this skips building kwargs for every node.
     def Sequence(self, name):
         """
         Adds a sequence Composite to the tree.
@@ -89,7 +109,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
 
-        self._internalNodeHandler(nodes.sequence.Sequence(name = name, memory = True))
+        self._internalNodeHandler(self._SequenceCls(name, True))
         return self
 
     def Selector(self, name):
@@ -100,7 +120,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
 
-        self._internalNodeHandler(nodes.selector.Selector(name = name, memory = True))
+        self._internalNodeHandler(self._SelectorCls(name, True))
         return self
 
     def Parallel(self, name, policy = common.ParallelPolicy.SuccessOnAll()):
@@ -112,7 +132,7 @@ class BehaviourTreeBuilder():
             policy (:class:`pybt.common.ParallelPolicy`): The parallel policy of this node
         """
 
-        self._internalNodeHandler(nodes.parallel.Parallel(name = name, policy = policy))
+        self._internalNodeHandler(self._ParallelCls(name, policy))
         return self
 #endregion
 
@@ -126,7 +146,7 @@ class BehaviourTreeBuilder():
             conditionCheckMethod (:class:`function`): A functional check that determines execution or not of the subtree
         """
         
-        self._internalNodeHandler(nodes.eternalGuard.EternalGuard(name = name, condition = conditionCheckMethod))
+        self._internalNodeHandler(self._EternalGuardCls(name = name, condition = conditionCheckMethod))
         return self
     
     def FailureIsRunning(self, name):
@@ -137,7 +157,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
 
-        self._internalNodeHandler(nodes.failureIsRunning.FailureIsRunning(name = name))
+        self._internalNodeHandler(self._FailureIsRunningCls(None, name))
         return self
     
     def FailureIsSuccess(self, name):
@@ -148,7 +168,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.failureIsSuccess.FailureIsSuccess(name = name))
+        self._internalNodeHandler(self._FailureIsSuccessCls(None, name))
         return self
     
     def RunningIsFailure(self, name):
@@ -159,7 +179,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.runningIsFailure.RunningIsFailure(name = name))
+        self._internalNodeHandler(self._RunningIsFailureCls(None, name))
         return self
     
     def RunningIsSuccess(self, name):
@@ -170,7 +190,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.runningIsSuccess.RunningIsSuccess(name = name))
+        self._internalNodeHandler(self._RunningIsSuccessCls(None, name))
         return self
     
     def SuccessIsFailure(self, name):
@@ -181,7 +201,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.successIsFailure.SuccessIsFailure(name = name))
+        self._internalNodeHandler(self._SuccessIsFailureCls(None, name))
         return self 
     
     def SuccessIsRunning(self, name):
@@ -192,7 +212,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.successIsRunning.SuccessIsRunning(name = name))
+        self._internalNodeHandler(self._SuccessIsRunningCls(None, name))
         return self 
 
     def Inverter(self, name):
@@ -203,7 +223,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.inverter.Inverter(name = name))
+        self._internalNodeHandler(self._InverterCls(None, name))
         return self
     
     def Oneshot(self, name, policy = common.OneShotPolicy.ON_SUCCESSFUL_COMPLETION):
@@ -214,7 +234,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.oneshot.OneShot(name = name, policy = policy))
+        self._internalNodeHandler(self._OneShotCls(None, name, policy))
         return self
         
     def StatusToBlackboard(self, name, variableName):
@@ -225,7 +245,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.statusToBlackboard.StatusToBlackboard(name = name, variable_name = variableName))
+        self._internalNodeHandler(self._StatusToBlackboardCls(name = name, variable_name = variableName))
         return self
     
     def Timeout(self, name, duration):
@@ -236,7 +256,7 @@ class BehaviourTreeBuilder():
             name (:class:`str`): The node name.
         """
         
-        self._internalNodeHandler(nodes.timeout.Timeout(name = name, duration = duration))
+        self._internalNodeHandler(self._TimeoutCls(None, name, duration))
         return self  
 #endregion
 
@@ -254,10 +274,5 @@ class BehaviourTreeBuilder():
         if self._root is None:
             raise SyntaxError("An action node can't be the root node to a Behaviour tree.")
 
-        if isinstance(self._currentNode, nodes.composite.Composite):
-                self._currentNode.add_child(actionClass)
-        elif isinstance(self._currentNode, nodes.decorator.Decorator):
-            self._currentNode.add_decorated(actionClass)
-
-        self._printNode(actionClass)
+        self._internalNodeHandler(actionClass, descend = False)
         return self
\ No newline at end of file
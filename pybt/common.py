@@ -42,6 +42,13 @@ class Status(enum.Enum):
     INVALID = "INVALID"
     """Behaviour is uninitialised and inactive, i.e. this is the status before first entry, and after a higher priority switch has occurred."""
 
+# Module level aliases of the status members. They are the very same enum
+# members, but skip the class attribute lookup when used on the tick path.
+SUCCESS = Status.SUCCESS
+FAILURE = Status.FAILURE
+RUNNING = Status.RUNNING
+INVALID = Status.INVALID
+
 class Duration(enum.Enum):
     """
     Naming conventions.
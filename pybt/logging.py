@@ -17,6 +17,13 @@ class Level(IntEnum):
     WARN = 2
     ERROR = 3
 
+# Module level aliases of the levels, the same members without the (slow)
+# enum class attribute lookup for the level checks made on every tick.
+DEBUG = Level.DEBUG
+INFO = Level.INFO
+WARN = Level.WARN
+ERROR = Level.ERROR
+
 
 # module variable
 level = Level.INFO
@@ -26,24 +33,30 @@ class Logger(object):
     :cvar override: whether or not the default python logger has been overridden.
     :vartype override: bool
     """
+    # one of these per behaviour, keep them small
+    __slots__ = ('prefix',)
 
     def __init__(self, name=None):
         self.prefix = '{:<20}'.format(name.replace("\n", " ")) + " : " if name else ""
 
-    def debug(self, msg):
+    def debug(self, msg, *args):
+        """
+        Log a debug message. Like the standard library loggers, any args
+        are %-formatted into the message only if it will be emitted.
+        """
         global level
-        if level < Level.INFO:
-            console.logdebug(self.prefix + msg)
+        if level < INFO:
+            console.logdebug(self.prefix + (msg % args if args else msg))
 
-    def info(self, msg):
+    def info(self, msg, *args):
         global level
-        if level < Level.WARN:
-            console.loginfo(self.prefix + msg)
+        if level < WARN:
+            console.loginfo(self.prefix + (msg % args if args else msg))
 
-    def warning(self, msg):
+    def warning(self, msg, *args):
         global level
-        if level < Level.ERROR:
-            console.logwarn(self.prefix + msg)
+        if level < ERROR:
+            console.logwarn(self.prefix + (msg % args if args else msg))
 
-    def error(self, msg):
-        console.logerror(self.prefix + msg)
+    def error(self, msg, *args):
+        console.logerror(self.prefix + (msg % args if args else msg))
@@ -10,26 +10,43 @@
 This is the node-level namespace of the pybt.composites package.
 """
 
-#Composites
-from . import composite
-from . import selector
-from . import sequence
-from . import parallel
-
-#Decorators
-from . import decorator
-from . import condition
-from . import eternalGuard
-from . import failureIsRunning
-from . import failureIsSuccess
-
-from . import runningIsFailure
-from . import runningIsSuccess
-
-from . import successIsRunning
-from . import successIsFailure
-
-from . import inverter
-from . import oneshot
-from . import statusToBlackboard
-from . import timeout
\ No newline at end of file
+##############################################################################
+# Imports
+##############################################################################
+
+import importlib
+
+# submodules are imported on first access (PEP 562) rather than at package load
+_submodules = (
+    # composites
+    "composite",
+    "selector",
+    "sequence",
+    "parallel",
+    # decorators
+    "decorator",
+    "condition",
+    "eternalGuard",
+    "failureIsRunning",
+    "failureIsSuccess",
+    "runningIsFailure",
+    "runningIsSuccess",
+    "successIsRunning",
+    "successIsFailure",
+    "inverter",
+    "oneshot",
+    "statusToBlackboard",
+    "timeout",
+)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        module = importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
@@ -76,18 +76,31 @@ class Composite(behaviour.Behaviour):
         name (:obj:`str`): the composite behaviour name
         children ([:class:`~py_trees.behaviour.Behaviour`]): list of children to add
     """
+    __slots__ = (
+        'current_child', '_current_child_index', '_any_non_invalid',
+        '_child_by_id', '_index_by_obj'
+    )
+
     def __init__(self,
                  name: typing.Union[str, common.Name]=common.Name.AUTO_GENERATED,
                  children: typing.List[behaviour.Behaviour]=None
                  ):
         super(Composite, self).__init__(name)
+        # set whenever a child may have left the INVALID state (added with
+        # a status, or ticked by this composite), cleared once they're all reset
+        self._any_non_invalid = False
+        # positions of the children, keyed by uuid and by object identity,
+        # so lookups while editing large composites don't scan the list
+        self._child_by_id = {}
+        self._index_by_obj = {}
         if children is not None:
             for child in children:
                 self.add_child(child)
         else:
             self.children = []
         self.current_child = None
-        pass
+        # position hint for current_child, see _current_child_position()
+        self._current_child_index = -1
 
     ############################################
     # Worker Overrides
@@ -106,34 +119,104 @@ class Composite(behaviour.Behaviour):
         Args:
             new_status (:class:`~py_trees.common.Status`): behaviour will transition to this new status
         """
-        self.logger.debug("%s.stop()[%s]" % (self.__class__.__name__, "%s->%s" % (self.status, new_status) if self.status != new_status else "%s" % new_status))
+        if self.status != new_status:
+            self.logger.debug("%s.stop()[%s->%s]", self.__class__.__name__, self.status, new_status)
+        else:
+            self.logger.debug("%s.stop()[%s]", self.__class__.__name__, new_status)
         # priority interrupted
         if new_status == common.Status.INVALID:
             self.current_child = None
             for child in self.children:
                 child.stop(new_status)
+            self._any_non_invalid = False
         # This part just replicates the Behaviour.stop function. We replicate it here so that
         # the Behaviour logging doesn't duplicate the composite logging here, just a bit cleaner this way.
         self.terminate(new_status)
         self.status = new_status
-        self.iterator = self.tick()
+        self.iterator = None
 
     def tip(self):
         """
-        Recursive function to extract the last running node of the tree.
+        Extract the last running node of the tree. Chains of composites are
+        descended in a loop, only the node at the end of the chain (leaf,
+        decorator or a composite with its own tip) is asked for its tip.
 
         Returns:
             :class::`~py_trees.behaviour.Behaviour`: the tip function of the current child of this composite or None
         """
-        if self.current_child is not None:
-            return self.current_child.tip()
-        else:
+        if self.current_child is None:
             return super().tip()
+        node = self.current_child
+        while type(node).tip is Composite.tip and node.current_child is not None:
+            node = node.current_child
+        if type(node).tip is Composite.tip:
+            # a composite without a current child
+            return behaviour.Behaviour.tip(node)
+        return node.tip()
 
     ############################################
     # Children
     ############################################
 
+    def _current_child_position(self):
+        """
+        Index of the current child amongst the children. The last known
+        position is checked first, so the linear search only happens if
+        the children were rearranged since.
+
+        Returns:
+            :obj:`int`: index of the current child
+
+        Raises:
+            ValueError: if the current child is not one of the children
+        """
+        index = self._current_child_index
+        children = self.children
+        if 0 <= index < len(children) and children[index] is self.current_child:
+            return index
+        index = children.index(self.current_child)
+        self._current_child_index = index
+        return index
+
+    def _reindex(self, start=0):
+        """
+        Refresh the recorded positions of the children from ``start`` onwards.
+
+        Args:
+            start (:obj:`int`): first index that moved
+        """
+        children = self.children
+        for index in range(start, len(children)):
+            child = children[index]
+            self._child_by_id[child.id] = index
+            self._index_by_obj[id(child)] = index
+
+    def _index_of(self, child):
+        """
+        Index of the child amongst the children. The recorded position is
+        verified and, should ``children`` have been edited directly, rebuilt.
+
+        Args:
+            child (:class:`~py_trees.behaviour.Behaviour`): child to look up
+
+        Returns:
+            :obj:`int`: index of the child
+
+        Raises:
+            ValueError: if the child is not one of the children
+        """
+        children = self.children
+        index = self._index_by_obj.get(id(child))
+        if index is not None and index < len(children) and children[index] is child:
+            return index
+        self._child_by_id.clear()
+        self._index_by_obj.clear()
+        self._reindex()
+        index = self._index_by_obj.get(id(child))
+        if index is None:
+            raise ValueError("'{}' is not a child of '{}'".format(child.name, self.name))
+        return index
+
     def add_child(self, child):
         """
         Adds a child.
@@ -150,10 +233,15 @@ class Composite(behaviour.Behaviour):
         """
         if not isinstance(child, behaviour.Behaviour):
             raise TypeError("children must be behaviours, but you passed in {}".format(type(child)))
+        index = len(self.children)
         self.children.append(child)
+        self._child_by_id[child.id] = index
+        self._index_by_obj[id(child)] = index
         if child.parent is not None:
             raise RuntimeError("behaviour '{}' already has parent '{}'".format(child.name, child.parent.name))
         child.parent = self
+        if child.status is not common.Status.INVALID:
+            self._any_non_invalid = True
         return child.id
 
     def add_children(self, children):
@@ -167,6 +255,19 @@ class Composite(behaviour.Behaviour):
             self.add_child(child)
         return self
 
+    def attach(self, child):
+        """
+        Generic hook used when assembling trees (e.g. by the builder), for
+        a composite this simply appends the child.
+
+        Args:
+            child (:class:`~py_trees.behaviour.Behaviour`): child to add
+
+        Returns:
+            uuid.UUID: unique id of the child
+        """
+        return self.add_child(child)
+
     def remove_child(self, child):
         """
         Remove the child behaviour from this composite.
@@ -183,8 +284,11 @@ class Composite(behaviour.Behaviour):
             self.current_child = None
         if child.status == common.Status.RUNNING:
             child.stop(common.Status.INVALID)
-        child_index = self.children.index(child)
-        self.children.remove(child)
+        child_index = self._index_of(child)
+        del self.children[child_index]
+        del self._child_by_id[child.id]
+        del self._index_by_obj[id(child)]
+        self._reindex(child_index)
         child.parent = None
         return child_index
 
@@ -197,9 +301,12 @@ class Composite(behaviour.Behaviour):
             if child.status == common.Status.RUNNING:
                 child.stop(common.Status.INVALID)
             child.parent = None
-        # makes sure to delete it for this class and all references to it
-        #   http://stackoverflow.com/questions/850795/clearing-python-lists
-        del self.children[:]
+        # in place, so every reference to the list sees it emptied
+        self.children.clear()
+        self._child_by_id.clear()
+        self._index_by_obj.clear()
+        self._current_child_index = -1
+        self._any_non_invalid = False
 
     def replace_child(self, child, replacement):
         """
@@ -209,8 +316,8 @@ class Composite(behaviour.Behaviour):
             child (:class:`~py_trees.behaviour.Behaviour`): child to delete
             replacement (:class:`~py_trees.behaviour.Behaviour`): child to insert
         """
-        self.logger.debug("%s.replace_child()[%s->%s]" % (self.__class__.__name__, child.name, replacement.name))
-        child_index = self.children.index(child)
+        self.logger.debug("%s.replace_child()[%s->%s]", self.__class__.__name__, child.name, replacement.name)
+        child_index = self._index_of(child)
         self.remove_child(child)
         self.insert_child(replacement, child_index)
         child.parent = None
@@ -225,11 +332,14 @@ class Composite(behaviour.Behaviour):
         Raises:
             IndexError: if the child was not found
         """
-        child = next((c for c in self.children if c.id == child_id), None)
-        if child is not None:
-            self.remove_child(child)
-        else:
-            raise IndexError('child was not found with the specified id [%s]' % child_id)
+        index = self._child_by_id.get(child_id)
+        children = self.children
+        if index is None or index >= len(children) or children[index].id != child_id:
+            # not recorded or out of date, fall back to looking for it
+            index = next((i for i, c in enumerate(children) if c.id == child_id), None)
+            if index is None:
+                raise IndexError('child was not found with the specified id [%s]' % child_id)
+        self.remove_child(children[index])
 
     def prepend_child(self, child):
         """
@@ -242,7 +352,10 @@ class Composite(behaviour.Behaviour):
             uuid.UUID: unique id of the child
         """
         self.children.insert(0, child)
+        self._reindex()
         child.parent = self
+        if child.status is not common.Status.INVALID:
+            self._any_non_invalid = True
         return child.id
 
     def insert_child(self, child, index):
@@ -258,5 +371,9 @@ class Composite(behaviour.Behaviour):
             uuid.UUID: unique id of the child
         """
         self.children.insert(index, child)
+        # negative indices count from the end, just refresh everything for those
+        self._reindex(index if index >= 0 else 0)
         child.parent = self
+        if child.status is not common.Status.INVALID:
+            self._any_non_invalid = True
         return child.id
\ No newline at end of file
@@ -8,6 +8,8 @@ class Condition(dec.Decorator):
     :data:`~py_trees.common.Status.RUNNING` while waiting and
     :data:`~py_trees.common.Status.SUCCESS` when the flip occurs.
     """
+    __slots__ = ('succeed_status',)
+
     def __init__(self,
                  child,
                  name=common.Name.AUTO_GENERATED,
@@ -84,6 +84,7 @@ from inspect import signature
 from .. import behaviour
 from ..bb import blackboard
 from .. import common
+from .. import logging
 
 ##############################################################################
 # Classes
@@ -108,6 +109,8 @@ class Decorator(behaviour.Behaviour):
     Raises:
         TypeError: if the child is not an instance of :class:`~py_trees.behaviour.Behaviour`
     """
+    __slots__ = ('decorated',)
+
     def __init__(
             self,
             child: behaviour.Behaviour = None,
@@ -136,6 +139,16 @@ class Decorator(behaviour.Behaviour):
         self.decorated = self.children[0]
         self.decorated.parent = self
 
+    def attach(self, child):
+        """
+        Generic hook used when assembling trees (e.g. by the builder), for
+        a decorator this sets the decorated child.
+
+        Args:
+            child (:class:`~py_trees.behaviour.Behaviour`): child to decorate
+        """
+        self.add_decorated(child)
+
     def tick(self):
         """
         A decorator's tick is exactly the same as a normal proceedings for
@@ -144,20 +157,20 @@ class Decorator(behaviour.Behaviour):
         Yields:
             :class:`~py_trees.behaviour.Behaviour`: a reference to itself or one of its children
         """
-        self.logger.debug("%s.tick()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick()", self.__class__.__name__)
         # initialise just like other behaviours/composites
-        if self.status != common.Status.RUNNING:
+        if self.status is not common.Status.RUNNING:
             self.initialise()
         # interrupt proceedings and process the child node
         # (including any children it may have as well)
-        for node in self.decorated.tick():
-            yield node
+        yield from self.decorated.tick()
         # resume normal proceedings for a Behaviour's tick
         new_status = self.update()
-        if new_status not in list(common.Status):
+        if not isinstance(new_status, common.Status):
             self.logger.error("A behaviour returned an invalid status, setting to INVALID [%s][%s]" % (new_status, self.name))
             new_status = common.Status.INVALID
-        if new_status != common.Status.RUNNING:
+        if new_status is not common.Status.RUNNING:
             self.stop(new_status)
         self.status = new_status
         yield self
@@ -170,7 +183,8 @@ class Decorator(behaviour.Behaviour):
         Args:
             new_status (:class:`~py_trees.common.Status`): the behaviour is transitioning to this new status
         """
-        self.logger.debug("%s.stop(%s)" % (self.__class__.__name__, new_status))
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.stop(%s)", self.__class__.__name__, new_status)
         self.terminate(new_status)
         # priority interrupt handling
         if new_status == common.Status.INVALID:
@@ -203,7 +217,8 @@ class Decorator(behaviour.Behaviour):
         Returns:
             :class:`~py_trees.common.Status`: the behaviour's new status :class:`~py_trees.common.Status`
         """
-        self.logger.debug("%s.update()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()", self.__class__.__name__)
         self.feedback_message = "'{0}' has status {1}, waiting for {2}".format(self.decorated.name, self.decorated.status, self.succeed_status)
         if self.decorated.status == self.succeed_status:
             return common.Status.SUCCESS
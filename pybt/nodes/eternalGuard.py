@@ -3,6 +3,26 @@ from typing import List, Set # noqa
 from . import decorator as dec
 from .. import behaviour
 from .. import common
+from .. import logging
+
+
+def _takes_blackboard(condition) -> bool:
+    """
+    Whether the condition expects the guard's blackboard client as its
+    'blackboard' argument. Guards often share a condition, so the signature
+    inspection is cached where the condition can be hashed.
+    """
+    try:
+        return _cached_takes_blackboard(condition)
+    except TypeError:  # unhashable callable
+        return _inspect_takes_blackboard(condition)
+
+
+def _inspect_takes_blackboard(condition) -> bool:
+    return "blackboard" in dec.signature(condition).parameters
+
+
+_cached_takes_blackboard = dec.functools.lru_cache(maxsize=256)(_inspect_takes_blackboard)
 
 class EternalGuard(dec.Decorator):
     """
@@ -70,6 +90,8 @@ class EternalGuard(dec.Decorator):
 
     .. seealso:: :meth:`py_trees.idioms.eternal_guard`
     """
+    __slots__ = ('blackboard', 'condition')
+
     def __init__(
             self,
             *,
@@ -78,15 +100,14 @@ class EternalGuard(dec.Decorator):
             # it as well. When typing_extensions are available (very recent) more generally, can use
             # Protocols to handle it. Probably also a sign that it's not a very clean api though...
             condition,
-            blackboard_keys: dec.Union[List[str], Set[str]]=[],
+            blackboard_keys: dec.Union[List[str], Set[str]]=(),
             name: dec.Union[str, common.Name]=common.Name.AUTO_GENERATED,
     ):
         super().__init__(name=name, child=child)
         self.blackboard = self.attach_blackboard_client(self.name)
         for key in blackboard_keys:
             self.blackboard.register_key(key=key, access=common.Access.READ)
-        condition_signature = dec.signature(condition)
-        if "blackboard" in [p.name for p in condition_signature.parameters.values()]:
+        if _takes_blackboard(condition):
             self.condition = dec.functools.partial(condition, self.blackboard)
         else:
             self.condition = condition
@@ -99,25 +120,27 @@ class EternalGuard(dec.Decorator):
         Yields:
             :class:`~py_trees.behaviour.Behaviour`: a reference to itself or one of its children
         """
-        self.logger.debug("%s.tick()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick()", self.__class__.__name__)
 
         # condition check
         result = self.condition()
-        if type(result) == common.Status:
-            result = False if result == common.Status.FAILURE else True
-        elif type(result) != bool:
+        if result is True or result is False:
+            pass  # the usual case, bool has just the two instances
+        elif type(result) is common.Status:
+            result = result is not common.FAILURE
+        else:
             error_message = "conditional check must return 'bool' or 'common.Status' [{}]".format(type(result))
             self.logger.error("The {}".format(error_message))
             raise RuntimeError(error_message)
 
         if not result:
             # abort, abort, the FSM is losing his noodles!!!
-            self.stop(common.Status.FAILURE)
+            self.stop(common.FAILURE)
             yield self
         else:
             # normal behaviour
-            for node in super().tick():
-                yield node
+            yield from super().tick()
 
     def update(self):
         """
@@ -1,10 +1,17 @@
 from . import decorator as dec
 from .. import common
 
+_FAILURE = common.Status.FAILURE
+_RUNNING = common.Status.RUNNING
+
+_PREFIX = "failure is running"
+
 class FailureIsRunning(dec.Decorator):
     """
     Dont stop running.
     """
+    __slots__ = ()
+
     def update(self):
         """
         Return the decorated child's status unless it is
@@ -14,8 +21,11 @@ class FailureIsRunning(dec.Decorator):
         Returns:
             :class:`~py_trees.common.Status`: the behaviour's new status :class:`~py_trees.common.Status`
         """
-        if self.decorated.status == common.Status.FAILURE:
-            self.feedback_message = "failure is running" + (" [%s]" % self.decorated.feedback_message if self.decorated.feedback_message else "")
-            return common.Status.RUNNING
-        self.feedback_message = self.decorated.feedback_message
-        return self.decorated.status
\ No newline at end of file
+        decorated = self.decorated
+        status = decorated.status
+        feedback_message = decorated.feedback_message
+        if status is _FAILURE:
+            self.feedback_message = "%s [%s]" % (_PREFIX, feedback_message) if feedback_message else _PREFIX
+            return _RUNNING
+        self.feedback_message = feedback_message
+        return status
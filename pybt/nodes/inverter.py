@@ -1,10 +1,18 @@
 from . import decorator as dec
 from .. import common
 
+# flipped status and feedback message, keyed by the decorated status
+_INVERTED = {
+    common.Status.SUCCESS: (common.Status.FAILURE, "success -> failure"),
+    common.Status.FAILURE: (common.Status.SUCCESS, "failure -> success"),
+}
+
 class Inverter(dec.Decorator):
     """
     A decorator that inverts the result of a class's update function.
     """
+    __slots__ = ()
+
     def __init__(self, child = None, name=common.Name.AUTO_GENERATED):
         """
         Init with the decorated child.
@@ -23,11 +31,11 @@ class Inverter(dec.Decorator):
         Returns:
             :class:`~py_trees.common.Status`: the behaviour's new status :class:`~py_trees.common.Status`
         """
-        if self.decorated.status == common.Status.SUCCESS:
-            self.feedback_message = "success -> failure"
-            return common.Status.FAILURE
-        elif self.decorated.status == common.Status.FAILURE:
-            self.feedback_message = "failure -> success"
-            return common.Status.SUCCESS
-        self.feedback_message = self.decorated.feedback_message
-        return self.decorated.status
\ No newline at end of file
+        decorated = self.decorated
+        status = decorated.status
+        inverted = _INVERTED.get(status)
+        if inverted is not None:
+            status, self.feedback_message = inverted
+            return status
+        self.feedback_message = decorated.feedback_message
+        return status
\ No newline at end of file
@@ -1,6 +1,7 @@
 from . import decorator as dec
 from .. import behaviour
 from .. import common
+from .. import logging
 
 class OneShot(dec.Decorator):
     """
@@ -18,6 +19,8 @@ class OneShot(dec.Decorator):
 
     .. seealso:: :meth:`py_trees.idioms.oneshot`
     """
+    __slots__ = ('final_status', 'policy')
+
     def __init__(self, child = None,
                  name=common.Name.AUTO_GENERATED,
                  policy=common.OneShotPolicy.ON_SUCCESSFUL_COMPLETION):
@@ -38,7 +41,8 @@ class OneShot(dec.Decorator):
         Bounce if the child has already successfully completed.
         """
         if self.final_status:
-            self.logger.debug("{}.update()[bouncing]".format(self.__class__.__name__))
+            if logging.level < logging.INFO:
+                self.logger.debug("%s.update()[bouncing]", self.__class__.__name__)
             return self.final_status
         return self.decorated.status
 
@@ -50,12 +54,10 @@ class OneShot(dec.Decorator):
         """
         if self.final_status:
             # ignore the child
-            for node in behaviour.Behaviour.tick(self):
-                yield node
+            yield from behaviour.Behaviour.tick(self)
         else:
             # tick the child
-            for node in dec.Decorator.tick(self):
-                yield node
+            yield from dec.Decorator.tick(self)
 
     def terminate(self, new_status):
         """
@@ -63,8 +65,9 @@ class OneShot(dec.Decorator):
         flag it so future ticks will block entry to the child.
         """
         if not self.final_status and new_status in self.policy.value:
-            self.logger.debug("{}.terminate({})[oneshot completed]".format(self.__class__.__name__, new_status))
+            self.logger.debug("%s.terminate(%s)[oneshot completed]", self.__class__.__name__, new_status)
             self.feedback_message = "oneshot completed"
             self.final_status = new_status
         else:
-            self.logger.debug("{}.terminate({})".format(self.__class__.__name__, new_status))
\ No newline at end of file
+            if logging.level < logging.INFO:
+                self.logger.debug("%s.terminate(%s)", self.__class__.__name__, new_status)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from . import composite as co
 from .. import common
+from .. import logging
 
 class Parallel(co.Composite):
     """
@@ -37,6 +38,8 @@ class Parallel(co.Composite):
     .. seealso::
        * :ref:`Context Switching Demo <py-trees-demo-context-switching-program>`
     """
+    __slots__ = ('policy',)
+
     def __init__(self,
                  name: co.typing.Union[str, common.Name]=common.Name.AUTO_GENERATED,
                  policy: common.ParallelPolicy.Base=common.ParallelPolicy.SuccessOnAll(),
@@ -76,12 +79,14 @@ class Parallel(co.Composite):
         Raises:
             RuntimeError: if the policy configuration was invalid
         """
-        self.logger.debug("%s.tick()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick()", self.__class__.__name__)
         self.validate_policy_configuration()
 
         # reset
         if self.status != common.Status.RUNNING:
-            self.logger.debug("%s.tick(): re-initialising" % self.__class__.__name__)
+            if logging.level < logging.INFO:
+                self.logger.debug("%s.tick(): re-initialising", self.__class__.__name__)
             for child in self.children:
                 # reset the children, this ensures old SUCCESS/FAILURE status flags
                 # don't break the synchronisation logic below
@@ -102,27 +107,32 @@ class Parallel(co.Composite):
         for child in self.children:
             if self.policy.synchronise and child.status == common.Status.SUCCESS:
                 continue
-            for node in child.tick():
-                yield node
+            if child._is_leaf:
+                child.tick_once_leaf()
+                yield child
+            else:
+                yield from child.tick()
 
-        # determine new status
+        # determine new status from a single pass over the children's statuses
+        children = self.children
+        statuses = [child.status for child in children]
         new_status = common.Status.RUNNING
-        self.current_child = self.children[-1]
-        try:
-            failed_child = next(child for child in self.children if child.status == common.Status.FAILURE)
-            self.current_child = failed_child
+        self.current_child = children[-1]
+        if common.Status.FAILURE in statuses:
+            self.current_child = children[statuses.index(common.Status.FAILURE)]
             new_status = common.Status.FAILURE
-        except StopIteration:
-            if type(self.policy) is common.ParallelPolicy.SuccessOnAll:
-                if all([c.status == common.Status.SUCCESS for c in self.children]):
+        else:
+            policy_type = type(self.policy)
+            if policy_type is common.ParallelPolicy.SuccessOnAll:
+                if statuses.count(common.Status.SUCCESS) == len(statuses):
                     new_status = common.Status.SUCCESS
-                    self.current_child = self.children[-1]
-            elif type(self.policy) is common.ParallelPolicy.SuccessOnOne:
-                successful = [child for child in self.children if child.status == common.Status.SUCCESS]
-                if successful:
+                    self.current_child = children[-1]
+            elif policy_type is common.ParallelPolicy.SuccessOnOne:
+                if common.Status.SUCCESS in statuses:
                     new_status = common.Status.SUCCESS
-                    self.current_child = successful[-1]
-            elif type(self.policy) is common.ParallelPolicy.SuccessOnSelected:
+                    # the last successful child
+                    self.current_child = children[len(statuses) - 1 - statuses[::-1].index(common.Status.SUCCESS)]
+            elif policy_type is common.ParallelPolicy.SuccessOnSelected:
                 if all([c.status == common.Status.SUCCESS for c in self.policy.children]):
                     new_status = common.Status.SUCCESS
                     self.current_child = self.policy.children[-1]
@@ -1,7 +1,12 @@
-import itertools
-
 from . import composite as co
 from .. import common
+from .. import logging
+
+# looked up once, these are compared by identity on every tick
+_SUCCESS = common.Status.SUCCESS
+_FAILURE = common.Status.FAILURE
+_RUNNING = common.Status.RUNNING
+_INVALID = common.Status.INVALID
 
 class Selector(co.Composite):
     """
@@ -28,10 +33,23 @@ class Selector(co.Composite):
         memory (:obj:`bool`): if :data:`~py_trees.common.Status.RUNNING` on the previous tick, resume with the :data:`~py_trees.common.Status.RUNNING` child
         children ([:class:`~py_trees.behaviour.Behaviour`]): list of children to add
     """
+    __slots__ = ('_memory',)
 
     def __init__(self, name = "Selector", memory = False, children = None):
-        super(Selector, self).__init__(name, children)
         self.memory = memory
+        super(Selector, self).__init__(name, children)
+
+    @property
+    def memory(self) -> bool:
+        """
+        Whether to resume with the :data:`~py_trees.common.Status.RUNNING` child
+        from the previous tick. :meth:`tick` picks the matching implementation.
+        """
+        return self._memory
+
+    @memory.setter
+    def memory(self, memory: bool):
+        self._memory = memory
 
     def tick(self):
         """
@@ -42,20 +60,95 @@ class Selector(co.Composite):
         Yields:
             :class:`~py_trees.behaviour.Behaviour`: a reference to itself or one of its children
         """
-        self.logger.debug("%s.tick()" % self.__class__.__name__)
+        return self._tick_memory() if self._memory else self._tick_nomemory()
+
+    def _reset(self):
+        """
+        Start over from the highest priority child and run the user's initialise().
+        """
+        # selector specific initialisation - leave initialise() free for users to
+        # re-implement without having to make calls to super()
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick() [!RUNNING->reset current_child]", self.__class__.__name__)
+        self.current_child = self.children[0] if self.children else None
+        self._current_child_index = 0
+
+        # reset the children - don't need to worry since they will be handled
+        # a) prior to a remembered starting point, or
+        # b) invalidated by a higher level priority
+
+        # user specific initialisation
+        self.initialise()
+
+    def _tick_memory(self):
+        """
+        :meth:`tick` for selectors with memory, resumes with the running child.
+        """
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick()", self.__class__.__name__)
         # initialise
-        if self.status != common.Status.RUNNING:
-            # selector specific initialisation - leave initialise() free for users to
-            # re-implement without having to make calls to super()
-            self.logger.debug("%s.tick() [!RUNNING->reset current_child]" % self.__class__.__name__)
-            self.current_child = self.children[0] if self.children else None
+        if self.status is not _RUNNING:
+            self._reset()
 
-            # reset the children - don't need to worry since they will be handled
-            # a) prior to a remembered starting point, or
-            # b) invalidated by a higher level priority
+        # customised work
+        self.update()
 
-            # user specific initialisation
-            self.initialise()
+        # nothing to do
+        if not self.children:
+            self.current_child = None
+            self.stop(_FAILURE)
+            yield self
+            return
+
+        # starting point
+        children = self.children
+        index = self._current_child_position()
+        # clear out preceding status' - not actually necessary but helps
+        # visualise the case of memory vs no memory
+        for i in range(index):
+            children[i].stop(_INVALID)
+
+        # actual work
+        previous = self.current_child
+        for i in range(index, len(children)):
+            child = children[i]
+            if child._is_leaf:
+                child.tick_once_leaf()
+                yield child
+            else:
+                # relay the child's traversal, it finishes by yielding itself
+                yield from child.tick()
+            status = child.status
+            if status is _RUNNING or status is _SUCCESS:
+                self.current_child = child
+                self._current_child_index = i
+                self.status = status
+                if child is not previous:
+                    # we interrupted, invalidate everything at a lower priority
+                    for j in range(i + 1, len(children)):
+                        lower = children[j]
+                        if lower.status is not _INVALID:
+                            lower.stop(_INVALID)
+                yield self
+                return
+        # all children failed, set failure ourselves and current child to the last bugger who failed us
+        self.status = _FAILURE
+        try:
+            self.current_child = children[-1]
+            self._current_child_index = len(children) - 1
+        except IndexError:
+            self.current_child = None
+        yield self
+
+    def _tick_nomemory(self):
+        """
+        :meth:`tick` for selectors without memory, re-evaluates every priority on each tick.
+        """
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick()", self.__class__.__name__)
+        # initialise
+        if self.status is not _RUNNING:
+            self._reset()
 
         # customised work
         self.update()
@@ -63,43 +156,42 @@ class Selector(co.Composite):
         # nothing to do
         if not self.children:
             self.current_child = None
-            self.stop(common.Status.FAILURE)
+            self.stop(_FAILURE)
             yield self
             return
 
         # starting point
-        if self.memory:
-            index = self.children.index(self.current_child)
-            # clear out preceding status' - not actually necessary but helps
-            # visualise the case of memory vs no memory
-            for child in itertools.islice(self.children, None, index):
-                child.stop(common.Status.INVALID)
-        else:
-            index = 0
+        children = self.children
+        index = 0
 
         # actual work
         previous = self.current_child
-        for child in itertools.islice(self.children, index, None):
-            for node in child.tick():
-                yield node
-                if node is child:
-                    if node.status == common.Status.RUNNING or node.status == common.Status.SUCCESS:
-                        self.current_child = child
-                        self.status = node.status
-                        if previous is None or previous != self.current_child:
-                            # we interrupted, invalidate everything at a lower priority
-                            passed = False
-                            for child in self.children:
-                                if passed:
-                                    if child.status != common.Status.INVALID:
-                                        child.stop(common.Status.INVALID)
-                                passed = True if child == self.current_child else passed
-                        yield self
-                        return
+        for i in range(index, len(children)):
+            child = children[i]
+            if child._is_leaf:
+                child.tick_once_leaf()
+                yield child
+            else:
+                # relay the child's traversal, it finishes by yielding itself
+                yield from child.tick()
+            status = child.status
+            if status is _RUNNING or status is _SUCCESS:
+                self.current_child = child
+                self._current_child_index = i
+                self.status = status
+                if child is not previous:
+                    # we interrupted, invalidate everything at a lower priority
+                    for j in range(i + 1, len(children)):
+                        lower = children[j]
+                        if lower.status is not _INVALID:
+                            lower.stop(_INVALID)
+                yield self
+                return
         # all children failed, set failure ourselves and current child to the last bugger who failed us
-        self.status = common.Status.FAILURE
+        self.status = _FAILURE
         try:
-            self.current_child = self.children[-1]
+            self.current_child = children[-1]
+            self._current_child_index = len(children) - 1
         except IndexError:
             self.current_child = None
         yield self
@@ -116,6 +208,6 @@ class Selector(co.Composite):
         """
         # retain information about the last running child if the new status is
         # SUCCESS or FAILURE
-        if new_status == common.Status.INVALID:
+        if new_status is _INVALID:
             self.current_child = None
         co.Composite.stop(self, new_status)
\ No newline at end of file
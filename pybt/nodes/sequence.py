@@ -1,9 +1,15 @@
-import itertools
 import typing
 
 from . import composite as co
 from .. import behaviour
 from .. import common
+from .. import logging
+
+# looked up once, these are compared by identity on every tick
+_SUCCESS = common.Status.SUCCESS
+_FAILURE = common.Status.FAILURE
+_RUNNING = common.Status.RUNNING
+_INVALID = common.Status.INVALID
 
 class Sequence(co.Composite):
     """
@@ -30,14 +36,28 @@ class Sequence(co.Composite):
         children: list of children to add
 
     """
+    __slots__ = ('_memory',)
+
     def __init__(
         self,
         name: str="Sequence",
         memory: bool=True,
         children: typing.List[behaviour.Behaviour]=None
     ):
-        super(Sequence, self).__init__(name, children)
         self.memory = memory
+        super(Sequence, self).__init__(name, children)
+
+    @property
+    def memory(self) -> bool:
+        """
+        Whether to resume with the :data:`~py_trees.common.Status.RUNNING` child
+        from the previous tick. :meth:`tick` picks the matching implementation.
+        """
+        return self._memory
+
+    @memory.setter
+    def memory(self, memory: bool):
+        self._memory = memory
 
     def tick(self):
         """
@@ -46,19 +66,37 @@ class Sequence(co.Composite):
         Yields:
             :class:`~py_trees.behaviour.Behaviour`: a reference to itself or one of its children
         """
-        self.logger.debug("%s.tick()" % self.__class__.__name__)
+        return self._tick_memory() if self._memory else self._tick_nomemory()
 
-        # initialise
-        index = 0
-        if self.status != common.Status.RUNNING or not self.memory:
-            self.current_child = self.children[0] if self.children else None
+    def _reset(self):
+        """
+        Start over from the first child, invalidating any that still hold a
+        status from before and running the user's initialise().
+        """
+        self.current_child = self.children[0] if self.children else None
+        self._current_child_index = 0
+        # skip the sweep if no child can have left the INVALID state since the last one
+        if self._any_non_invalid:
             for child in self.children:
-                if child.status != common.Status.INVALID:
-                    child.stop(common.Status.INVALID)
-            # user specific initialisation
-            self.initialise()
-        else:  # self.memory is True and status is RUNNING
-            index = self.children.index(self.current_child)
+                if child.status is not _INVALID:
+                    child.stop(_INVALID)
+            self._any_non_invalid = False
+        # user specific initialisation
+        self.initialise()
+
+    def _tick_memory(self):
+        """
+        :meth:`tick` for sequences with memory, resumes with the running child.
+        """
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick()", self.__class__.__name__)
+
+        # initialise
+        if self.status is _RUNNING:
+            index = self._current_child_position()
+        else:
+            self._reset()
+            index = 0
 
         # customised work
         self.update()
@@ -66,24 +104,76 @@ class Sequence(co.Composite):
         # nothing to do
         if not self.children:
             self.current_child = None
-            self.stop(common.Status.SUCCESS)
+            self.stop(_SUCCESS)
             yield self
             return
 
         # actual work
-        for child in itertools.islice(self.children, index, None):
-            for node in child.tick():
-                yield node
-                if node is child and node.status != common.Status.SUCCESS:
-                    self.status = node.status
-                    yield self
-                    return
-            try:
-                # advance if there is 'next' sibling
-                self.current_child = self.children[index + 1]
-                index += 1
-            except IndexError:
-                pass
-
-        self.stop(common.Status.SUCCESS)
-        yield self
\ No newline at end of file
+        children = self.children
+        self._any_non_invalid = True
+        for i in range(index, len(children)):
+            child = children[i]
+            if child._is_leaf:
+                child.tick_once_leaf()
+                yield child
+            else:
+                # relay the child's traversal, it finishes by yielding itself
+                yield from child.tick()
+            if child.status is not _SUCCESS:
+                self.status = child.status
+                yield self
+                return
+            # advance if there is 'next' sibling
+            following = index + 1
+            if following < len(children):
+                self.current_child = children[following]
+                index = following
+                self._current_child_index = following
+
+        self.stop(_SUCCESS)
+        yield self
+
+    def _tick_nomemory(self):
+        """
+        :meth:`tick` for sequences without memory, starts over from the first child every tick.
+        """
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.tick()", self.__class__.__name__)
+
+        # initialise
+        self._reset()
+
+        # customised work
+        self.update()
+
+        # nothing to do
+        if not self.children:
+            self.current_child = None
+            self.stop(_SUCCESS)
+            yield self
+            return
+
+        # actual work
+        children = self.children
+        self._any_non_invalid = True
+        index = 0
+        for child in children:
+            if child._is_leaf:
+                child.tick_once_leaf()
+                yield child
+            else:
+                # relay the child's traversal, it finishes by yielding itself
+                yield from child.tick()
+            if child.status is not _SUCCESS:
+                self.status = child.status
+                yield self
+                return
+            # advance if there is 'next' sibling
+            following = index + 1
+            if following < len(children):
+                self.current_child = children[following]
+                index = following
+                self._current_child_index = following
+
+        self.stop(_SUCCESS)
+        yield self
@@ -1,6 +1,7 @@
 from . import decorator as dec
 from .. import behaviour
 from .. import common
+from .. import utilities
 
 class StatusToBlackboard(dec.Decorator):
     """
@@ -11,6 +12,8 @@ class StatusToBlackboard(dec.Decorator):
         variable_name: name of the blackboard variable, may be nested, e.g. foo.status
         name: the decorator name
     """
+    __slots__ = ('blackboard', 'key', 'key_attributes', 'variable_name', '_write')
+
     def __init__(
             self,
             *,
@@ -20,11 +23,12 @@ class StatusToBlackboard(dec.Decorator):
     ):
         super().__init__(child=child, name=name)
         self.variable_name = variable_name
-        name_components = variable_name.split('.')
-        self.key = name_components[0]
-        self.key_attributes = '.'.join(name_components[1:])  # empty string if no other parts
+        # key_attributes is an empty string if not nested
+        self.key, self.key_attributes = utilities.split_variable_name(variable_name)
         self.blackboard = self.attach_blackboard_client(self.name)
         self.blackboard.register_key(key=self.key, access=common.Access.WRITE)
+        # name resolved once, update() just hands over the value (overwrites)
+        self._write = self.blackboard.prepare_write(variable_name)
 
     def update(self):
         """
@@ -32,9 +36,6 @@ class StatusToBlackboard(dec.Decorator):
 
         Returns: the decorated child's status
         """
-        self.blackboard.set(
-            name=self.variable_name,
-            value=self.decorated.status,
-            overwrite=True
-        )
-        return self.decorated.status
+        status = self.decorated.status
+        self._write(status)
+        return status
@@ -1,10 +1,17 @@
 from . import decorator as dec
 from .. import common
 
+_RUNNING = common.Status.RUNNING
+_SUCCESS = common.Status.SUCCESS
+
+_PREFIX = "success is running"
+
 class SuccessIsRunning(dec.Decorator):
     """
     It never ends...
     """
+    __slots__ = ()
+
     def update(self):
         """
         Return the decorated child's status unless it is
@@ -14,8 +21,11 @@ class SuccessIsRunning(dec.Decorator):
         Returns:
             :class:`~py_trees.common.Status`: the behaviour's new status :class:`~py_trees.common.Status`
         """
-        if self.decorated.status == common.Status.SUCCESS:
-            self.feedback_message = "success is running [%s]" % self.decorated.feedback_message
-            return common.Status.RUNNING
-        self.feedback_message = self.decorated.feedback_message
-        return self.decorated.status
\ No newline at end of file
+        decorated = self.decorated
+        status = decorated.status
+        feedback_message = decorated.feedback_message
+        if status is _SUCCESS:
+            self.feedback_message = "%s [%s]" % (_PREFIX, feedback_message)
+            return _RUNNING
+        self.feedback_message = feedback_message
+        return status
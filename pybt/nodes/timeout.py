@@ -4,6 +4,8 @@ from . import decorator as dec
 from .. import behaviour
 from .. import common
 
+_monotonic = time.monotonic
+
 class Timeout(dec.Decorator):
     """
     A decorator that applies a timeout pattern to an existing behaviour.
@@ -13,6 +15,8 @@ class Timeout(dec.Decorator):
     simply directly tick and return with the same status
     as that of it's encapsulated behaviour.
     """
+    __slots__ = ('duration', 'finish_time')
+
     def __init__(self,
                  child: behaviour.Behaviour = None,
                  name: dec.Union[str, common.Name]=common.Name.AUTO_GENERATED,
@@ -33,7 +37,7 @@ class Timeout(dec.Decorator):
         """
         Reset the feedback message and finish time on behaviour entry.
         """
-        self.finish_time = time.monotonic() + self.duration
+        self.finish_time = _monotonic() + self.duration
         self.feedback_message = ""
 
     def update(self):
@@ -41,17 +45,19 @@ class Timeout(dec.Decorator):
         Terminate the child and return :data:`~py_trees.common.Status.FAILURE`
         if the timeout is exceeded.
         """
-        current_time = time.monotonic()
-        if self.decorated.status == common.Status.RUNNING and current_time > self.finish_time:
-            self.feedback_message = "timed out"
-            self.logger.debug("{}.update() {}".format(self.__class__.__name__, self.feedback_message))
-            # invalidate the decorated (i.e. cancel it), could also put this logic in a terminate() method
-            self.decorated.stop(common.Status.INVALID)
-            return common.Status.FAILURE
-        if self.decorated.status == common.Status.RUNNING:
+        current_time = _monotonic()
+        status = self.decorated.status
+        if status is not common.Status.RUNNING:
+            self.feedback_message = "child finished before timeout triggered"
+            return status
+        if current_time <= self.finish_time:
+            # still shown by the display, so this one isn't gated on the log level
             self.feedback_message = "time still ticking ... [remaining: {}s]".format(
                 self.finish_time - current_time
             )
-        else:
-            self.feedback_message = "child finished before timeout triggered"
-        return self.decorated.status
\ No newline at end of file
+            return status
+        self.feedback_message = "timed out"
+        self.logger.debug("%s.update() %s", self.__class__.__name__, self.feedback_message)
+        # invalidate the decorated (i.e. cancel it), could also put this logic in a terminate() method
+        self.decorated.stop(common.Status.INVALID)
+        return common.Status.FAILURE
@@ -20,6 +20,7 @@ import time
 
 from . import behaviour
 from . import common
+from . import logging
 
 ##############################################################################
 # Behaviours
@@ -65,7 +66,8 @@ class Timer(behaviour.Behaviour):
         """
         Store the expected finishing time.
         """
-        self.logger.debug("%s.initialise()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.initialise()", self.__class__.__name__)
         if self.finish_time is None:
             self.finish_time = time.time() + self.duration
         self.feedback_message = "configured to fire in '{0}' seconds".format(self.duration)
@@ -75,7 +77,8 @@ class Timer(behaviour.Behaviour):
         Check current time against the expected finishing time. If it is in excess, flip to
         :data:`~py_trees.common.Status.SUCCESS`.
         """
-        self.logger.debug("%s.update()" % self.__class__.__name__)
+        if logging.level < logging.INFO:
+            self.logger.debug("%s.update()", self.__class__.__name__)
         current_time = time.time()
         if current_time > self.finish_time:
             self.feedback_message = "timer ran out [{0}]".format(self.duration)
@@ -90,7 +93,11 @@ class Timer(behaviour.Behaviour):
         """
         Clear the expected finishing time.
         """
-        self.logger.debug("%s.terminate(%s)" % (self.__class__.__name__, "%s->%s" % (self.status, new_status) if self.status != new_status else "%s" % new_status))
+        if logging.level < logging.INFO:
+            if self.status != new_status:
+                self.logger.debug("%s.terminate(%s->%s)", self.__class__.__name__, self.status, new_status)
+            else:
+                self.logger.debug("%s.terminate(%s)", self.__class__.__name__, new_status)
         # clear the time if finishing with SUCCESS or in the case of an interruption from INVALID
         if new_status == common.Status.SUCCESS or new_status == common.Status.INVALID:
             self.finish_time = None
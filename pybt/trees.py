@@ -160,6 +160,7 @@ class BehaviourTree(object):
         self.post_tick_handlers = []
         self.interrupt_tick_tocking = False
         self.tree_update_handler = None  # child classes can utilise this one
+        self._nodes = None  # flattened tree, see freeze()
 
     def add_pre_tick_handler(self, handler: typing.Callable[['BehaviourTree'], None]):
         """
@@ -207,6 +208,29 @@ class BehaviourTree(object):
         """
         self.visitors.append(visitor)
 
+    def freeze(self):
+        """
+        Record the nodes of the tree in a flat list. Crawls over the entire tree
+        (full visitors, looking up subtrees by id, shutdown) then run over that list
+        instead of descending through the nested generators of each composite.
+        Ticking is unaffected, the composites still decide which children get ticked.
+
+        Call this once the tree has been assembled. Pruning, inserting and replacing
+        subtrees via this class keep the list up to date, but if composites are
+        modified directly, call it again afterwards.
+        """
+        self._nodes = list(self.root.iterate())
+
+    def _iterate(self):
+        """
+        All the nodes of the tree, from the flattened list if the tree was frozen.
+        """
+        return self.root.iterate() if self._nodes is None else self._nodes
+
+    def _refreeze(self):
+        if self._nodes is not None:
+            self.freeze()
+
     def prune_subtree(self, unique_id):
         """
         Prune a subtree given the unique id of the root of the subtree.
@@ -223,11 +247,12 @@ class BehaviourTree(object):
         # TODO: convert this to throwing exceptions instead
         if self.root.id == unique_id:
             raise RuntimeError("may not prune the root node")
-        for child in self.root.iterate():
+        for child in self._iterate():
             if child.id == unique_id:
                 parent = child.parent
                 if parent is not None:
                     parent.remove_child(child)
+                    self._refreeze()
                     if self.tree_update_handler is not None:
                         self.tree_update_handler()
                     return True
@@ -258,11 +283,12 @@ class BehaviourTree(object):
            that relies on the id of the sibling node it should be inserted before/after.
         """
         # TODO: convert this to throwing exceptions instead
-        for node in self.root.iterate():
+        for node in self._iterate():
             if node.id == unique_id:
                 if not isinstance(node, Composite):
                     raise TypeError("parent must be a Composite behaviour.")
                 node.insert_child(child, index)
+                self._refreeze()
                 if self.tree_update_handler is not None:
                     self.tree_update_handler()
                 return True
@@ -286,11 +312,12 @@ class BehaviourTree(object):
         # TODO: convert this to throwing exceptions instead
         if self.root.id == unique_id:
             raise RuntimeError("may not replace the root node")
-        for child in self.root.iterate():
+        for child in self._iterate():
             if child.id == unique_id:
                 parent = child.parent
                 if parent is not None:
                     parent.replace_child(child, subtree)
+                    self._refreeze()
                     if self.tree_update_handler is not None:
                         self.tree_update_handler()
                     return True
@@ -349,13 +376,20 @@ class BehaviourTree(object):
             visitor.initialise()
 
         # tick
-        for node in self.root.tick():
-            for visitor in [visitor for visitor in self.visitors if not visitor.full]:
-                node.visit(visitor)
-
-        for node in self.root.iterate():
-            for visitor in [visitor for visitor in self.visitors if visitor.full]:
-                node.visit(visitor)
+        traversal_visitors = [visitor for visitor in self.visitors if not visitor.full]
+        full_visitors = [visitor for visitor in self.visitors if visitor.full]
+        if traversal_visitors:
+            for node in self.root.tick():
+                for visitor in traversal_visitors:
+                    node.visit(visitor)
+        else:
+            self.root.tick_once()
+
+        # only crawl the entire tree if someone is interested in it
+        if full_visitors:
+            for node in self._iterate():
+                for visitor in full_visitors:
+                    node.visit(visitor)
 
         # post
         for visitor in self.visitors:
@@ -430,5 +464,5 @@ class BehaviourTree(object):
         """
         # TODO: this method is still quite naive .. could use similar visitors and
         # timeout mechanisms as used in setup()
-        for node in self.root.iterate():
+        for node in self._iterate():
             node.shutdown()
@@ -15,7 +15,9 @@ Assorted utility functions.
 # Imports
 ##############################################################################
 
+import functools
 import multiprocessing
+import operator
 import os
 import re
 import traceback
@@ -72,6 +74,36 @@ def truncate(original: str, length: int) -> str:
     s = (original[:length - 3] + '...') if len(original) > length else original
     return s
 
+
+@functools.lru_cache(maxsize=1024)
+def split_variable_name(name: str) -> typing.Tuple[str, str]:
+    """
+    Split a (possibly nested) blackboard variable name into its key and
+    the trailing attributes, e.g. 'battery.percentage' -> ('battery', 'percentage').
+    The same handful of names turn up over and over, so results are cached.
+
+    Args:
+        name: the variable name to split
+    Returns:
+        the key and its attributes (empty string if not nested)
+    """
+    key, unused_separator, key_attributes = name.partition('.')
+    return key, key_attributes
+
+
+@functools.lru_cache(maxsize=1024)
+def attribute_getter(key_attributes: str) -> typing.Callable[[typing.Any], typing.Any]:
+    """
+    Cached :func:`operator.attrgetter` for the nested part of a blackboard
+    variable name, e.g. 'percentage' or 'pose.position.x'.
+
+    Args:
+        key_attributes: dotted attribute path
+    Returns:
+        the getter for that path
+    """
+    return operator.attrgetter(key_attributes)
+
 ##############################################################################
 # System Tools
 ##############################################################################
@@ -10,17 +10,20 @@ class DisplaySnapshotVisitor(SnapshotVisitor):
     Args:
         display_blackboard: print to the console the relevant part of the blackboard associated with behaviours on the visited path
         display_activity_stream: print to the console a log of the activity on the blackboard over the last tick
+        display_only_on_change: skip printing on ticks where neither the visited path nor its statuses changed
     """
     def __init__(
             self,
             display_only_visited_behaviours=False,
             display_blackboard: bool=False,
-            display_activity_stream: bool=False
+            display_activity_stream: bool=False,
+            display_only_on_change: bool=False
     ):
         super().__init__()
         self.display_only_visited_behaviours = display_only_visited_behaviours
         self.display_blackboard = display_blackboard
         self.display_activity_stream = display_activity_stream
+        self.display_only_on_change = display_only_on_change
         if self.display_activity_stream:
             blackboard.Blackboard.enable_activity_stream()
 
@@ -32,11 +35,13 @@ class DisplaySnapshotVisitor(SnapshotVisitor):
 
     def run(self, behaviour):
         self.root = behaviour  # last behaviour visited will always be the root
-        super().run(behaviour)
+        # called for every visited behaviour, skip building a super() proxy each time
+        SnapshotVisitor.run(self, behaviour)
 
     def finalise(self):
         #@TODO: Fix display
-        pass
+        if self.display_only_on_change and not self.changed:
+            return  # don't render what would be a repeat of the last tick
         print(
             "\n" +
             display.unicode_tree(
@@ -44,14 +44,15 @@ class SnapshotVisitor(VisitorBase):
         Args:
             behaviour (:class:`~py_trees.behaviour.Behaviour`): behaviour that is ticking
         """
-        # behaviour status
-        self.visited[behaviour.id] = behaviour.status
-        try:
-            if self.visited[behaviour.id] != self.previously_visited[behaviour.id]:
-                self.changed = True
-        except KeyError:
+        # behaviour status (behaviours not visited last tick come back as None, also a change)
+        behaviour_id = behaviour.id
+        status = behaviour.status
+        self.visited[behaviour_id] = status
+        if self.previously_visited.get(behaviour_id) != status:
             self.changed = True
         # blackboards
+        # (initialise() starts fresh sets every tick, so they can be grown in place)
+        visited_blackboard_keys = self.visited_blackboard_keys
         for blackboard in behaviour.blackboards:
             self.visited_blackboard_client_ids.add(blackboard.id())
-            self.visited_blackboard_keys = self.visited_blackboard_keys | blackboard.read | blackboard.write | blackboard.exclusive
\ No newline at end of file
+            visited_blackboard_keys.update(blackboard.read, blackboard.write, blackboard.exclusive)
\ No newline at end of file
@@ -0,0 +1,82 @@
+import unittest
+
+from pybt import behaviour
+from pybt import common
+from pybt.nodes.inverter import Inverter
+from pybt.nodes.selector import Selector
+from pybt.nodes.sequence import Sequence
+
+
+class CountingBehaviour(behaviour.Behaviour):
+    __slots__ = ('updates', 'result')
+
+    def __init__(self, name, result=common.Status.SUCCESS):
+        super().__init__(name=name)
+        self.updates = 0
+        self.result = result
+
+    def update(self):
+        self.updates += 1
+        return self.result
+
+
+class TickEveryNTests(unittest.TestCase):
+
+    ticks = 20
+    every_n = 5
+
+    def tick(self, root):
+        for unused_tick in range(self.ticks):
+            root.tick_once()
+
+    def throttled(self, result=common.Status.SUCCESS):
+        counter = CountingBehaviour(name="Counter", result=result)
+        counter.tick_every_n = self.every_n
+        return counter
+
+    def test_root(self):
+        counter = self.throttled()
+        self.tick(counter)
+        self.assertEqual(counter.updates, self.ticks // self.every_n)
+        self.assertEqual(counter.status, common.Status.SUCCESS)
+
+    def test_sequence_without_memory(self):
+        counter = self.throttled()
+        root = Sequence(name="Sequence", memory=False, children=[counter, CountingBehaviour(name="Sibling")])
+        self.tick(root)
+        self.assertEqual(counter.updates, self.ticks // self.every_n)
+        self.assertEqual(root.status, common.Status.SUCCESS)
+
+    def test_selector(self):
+        counter = self.throttled(result=common.Status.FAILURE)
+        root = Selector(name="Selector", children=[counter, CountingBehaviour(name="Fallback")])
+        self.tick(root)
+        self.assertEqual(counter.updates, self.ticks // self.every_n)
+        self.assertEqual(counter.status, common.Status.FAILURE)
+        self.assertEqual(root.status, common.Status.SUCCESS)
+
+    def test_decorated(self):
+        counter = self.throttled()
+        root = Inverter(name="Inverter", child=counter)
+        self.tick(root)
+        self.assertEqual(counter.updates, self.ticks // self.every_n)
+        self.assertEqual(root.status, common.Status.FAILURE)
+
+    def test_interrupted_running_behaviour_is_updated(self):
+        counter = self.throttled(result=common.Status.RUNNING)
+        counter.tick_once()
+        counter.stop(common.Status.INVALID)
+        counter.tick_once()
+        self.assertEqual(counter.updates, 2)
+
+    def test_rejected_on_non_leaves(self):
+        with self.assertRaises(TypeError):
+            Sequence(name="Sequence", memory=False).tick_every_n = self.every_n
+        with self.assertRaises(TypeError):
+            Inverter(name="Inverter", child=CountingBehaviour(name="Child")).tick_every_n = self.every_n
+        with self.assertRaises(ValueError):
+            CountingBehaviour(name="Counter").tick_every_n = 0
+
+
+if __name__ == '__main__':
+    unittest.main()
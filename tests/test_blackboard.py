@@ -0,0 +1,37 @@
+import unittest
+
+from pybt import common
+from pybt.bb.blackboard import Blackboard
+from pybt.bb.client import Client
+
+
+class IntermediateVariableFetcherTests(unittest.TestCase):
+
+    def setUp(self):
+        Blackboard.clear()
+        self.client = Client(name="client")
+        for key in ("/foo/get", "/foo/set", "/foo/bar"):
+            self.client.register_key(key=key, access=common.Access.WRITE)
+        Blackboard.set("/foo/get", 1)
+        Blackboard.set("/foo/set", 2)
+        Blackboard.set("/foo/bar", 3)
+
+    def tearDown(self):
+        Blackboard.clear()
+
+    def test_get_nested_variables(self):
+        self.assertEqual(self.client.foo.get, 1)
+        self.assertEqual(self.client.foo.set, 2)
+        self.assertEqual(self.client.foo.bar, 3)
+
+    def test_set_nested_variables(self):
+        self.client.foo.get = 10
+        self.client.foo.set = 20
+        self.client.foo.bar = 30
+        self.assertEqual(Blackboard.get("/foo/get"), 10)
+        self.assertEqual(Blackboard.get("/foo/set"), 20)
+        self.assertEqual(Blackboard.get("/foo/bar"), 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
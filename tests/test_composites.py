@@ -0,0 +1,30 @@
+import unittest
+
+from pybt.nodes.parallel import Parallel
+from pybt.nodes.selector import Selector
+from pybt.nodes.sequence import Sequence
+
+
+class SlotsTests(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        for composite in (
+            Selector(name="Selector", memory=False),
+            Selector(name="Selector", memory=True),
+            Sequence(name="Sequence", memory=False),
+            Sequence(name="Sequence", memory=True),
+            Parallel(name="Parallel"),
+        ):
+            with self.subTest(composite=composite.name, memory=getattr(composite, "memory", None)):
+                self.assertFalse(hasattr(composite, "__dict__"))
+
+    def test_memory_switches_tick(self):
+        sequence = Sequence(name="Sequence", memory=True)
+        sequence.memory = False
+        self.assertFalse(sequence.memory)
+        sequence.tick_once()
+        self.assertFalse(hasattr(sequence, "__dict__"))
+
+
+if __name__ == '__main__':
+    unittest.main()
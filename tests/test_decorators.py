@@ -0,0 +1,83 @@
+import unittest
+
+from pybt import behaviour
+from pybt import common
+from pybt.nodes.failureIsRunning import FailureIsRunning
+from pybt.nodes.failureIsSuccess import FailureIsSuccess
+from pybt.nodes.inverter import Inverter
+from pybt.nodes.runningIsFailure import RunningIsFailure
+from pybt.nodes.runningIsSuccess import RunningIsSuccess
+from pybt.nodes.successIsFailure import SuccessIsFailure
+from pybt.nodes.successIsRunning import SuccessIsRunning
+
+
+class Returns(behaviour.Behaviour):
+    __slots__ = ('result', 'message')
+
+    def __init__(self, result, message):
+        super().__init__(name=result.name)
+        self.result = result
+        self.message = message
+
+    def update(self):
+        self.feedback_message = self.message
+        return self.result
+
+
+S = common.Status.SUCCESS
+F = common.Status.FAILURE
+R = common.Status.RUNNING
+
+
+class StatusConversionTests(unittest.TestCase):
+
+    def check(self, decorator_type, cases):
+        for status, message, expected_status, expected_message in cases:
+            with self.subTest(decorator=decorator_type.__name__, status=status, message=message):
+                decorator = decorator_type(child=Returns(status, message))
+                decorator.tick_once()
+                self.assertIs(decorator.status, expected_status)
+                self.assertEqual(decorator.feedback_message, expected_message)
+
+    def cases(self, converted, to, prefix, always_bracket=False):
+        cases = []
+        for status in (S, F, R):
+            for message in ("", "busy"):
+                if status is converted:
+                    if message or always_bracket:
+                        expected = "{} [{}]".format(prefix, message)
+                    else:
+                        expected = prefix
+                    cases.append((status, message, to, expected))
+                else:
+                    cases.append((status, message, status, message))
+        return cases
+
+    def test_failure_is_running(self):
+        self.check(FailureIsRunning, self.cases(F, R, "failure is running"))
+
+    def test_failure_is_success(self):
+        self.check(FailureIsSuccess, self.cases(F, S, "failure is success"))
+
+    def test_success_is_running(self):
+        self.check(SuccessIsRunning, self.cases(S, R, "success is running", always_bracket=True))
+
+    def test_success_is_failure(self):
+        self.check(SuccessIsFailure, self.cases(S, F, "success is failure"))
+
+    def test_running_is_failure(self):
+        self.check(RunningIsFailure, self.cases(R, F, "running is failure"))
+
+    def test_running_is_success(self):
+        self.check(RunningIsSuccess, self.cases(R, S, "running is success"))
+
+    def test_inverter(self):
+        self.check(Inverter, [
+            (S, "busy", F, "success -> failure"),
+            (F, "busy", S, "failure -> success"),
+            (R, "busy", R, "busy"),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()